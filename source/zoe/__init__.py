@@ -4,6 +4,9 @@
 from zoe_application.application import App
 from zoe_application.zoe_metadata import ZoeMetadata
 from zoe_net.server import Server
+from zoe_net.async_server import AsyncServer
+from zoe_net.admission import AdmissionControl
+from zoe_net.listener import Listener
 def who_made_this():
     """Meet the dogs behind Zoe Framework 🐾"""
     App._easter_egg()
@@ -20,6 +23,8 @@ from zoe_http.handler import Handler
 from zoe_http.middleware import Middleware
 from zoe_http.method import HttpMethod
 from zoe_http.bytes import Bytes
+from zoe_http.header_block import HeaderBlock
+from zoe_http._request_util.upload_file import UploadFile
 
 # Router
 from zoe_router.router import Router
@@ -57,6 +62,7 @@ from zoe_exceptions.http_exceptions.exc_not_found import RouteNotFoundException
 from zoe_exceptions.http_exceptions.exc_internal_exc import InternalServerException
 from zoe_exceptions.schemas_exceptions.exc_base import ErrorCode
 from zoe_exceptions.schemas_exceptions.exc_aggregate import ZoeSchemaAggregateException
+from zoe_exceptions.schemas_exceptions.exc_schema import SchemaError
 
 # Environment
 from zoe_env.env import Env
@@ -65,9 +71,9 @@ __all__ = [ # type: ignore
     # Utils
     "Bytes", "ZoeMetadata", "Env",
     # Core
-    "App", "Server",
+    "App", "Server", "AsyncServer", "AdmissionControl", "Listener",
     # HTTP
-    "Request", "Response", "HttpCode", "Handler", "Middleware", "HttpMethod", "Bytes"
+    "Request", "Response", "HttpCode", "Handler", "Middleware", "HttpMethod", "Bytes", "UploadFile", "HeaderBlock",
     # Router
     "Router", "Route", "Routes",
     # Schema
@@ -82,5 +88,5 @@ __all__ = [ # type: ignore
     "Helmet", "HelmetCrossOriginEmbedderPolicy", "HelmetPermissionsPolicy", "StaticFiles",
     # Exceptions
     "ZoeHttpException", "RouteNotFoundException", "InternalServerException",
-    "ErrorCode", "ZoeSchemaAggregateException",
+    "ErrorCode", "ZoeSchemaAggregateException", "SchemaError",
 ]
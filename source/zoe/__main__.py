@@ -1,5 +1,40 @@
+import argparse
+import importlib
+import os
 import sys
-from zoe import ZoeMetadata
+from zoe import ZoeMetadata, Server, Listener
+
+def serve(args: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="python -m zoe serve")
+    parser.add_argument("target", help="application to serve, as 'module:attribute' (e.g. 'main:app')")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix-socket", metavar="PATH", help="listen on a Unix domain socket instead of host:port")
+    parser.add_argument("--backlog", type=int, default=1024, help="pending connection queue length")
+    parser.add_argument("--workers", type=int, default=1, help="number of pre-forked worker processes")
+    parser.add_argument("--cpu-affinity", action="store_true", help="pin each worker to its own CPU")
+    parser.add_argument("--drain-timeout", type=float, default=30.0, help="seconds in-flight requests get to finish on shutdown")
+    options = parser.parse_args(args)
+
+    module_name, _, attribute = options.target.partition(":")
+    sys.path.insert(0, os.getcwd())
+    module = importlib.import_module(module_name)
+    application = getattr(module, attribute or "app", None)
+    if application is None:
+        parser.error(f"module '{module_name}' has no attribute '{attribute or 'app'}'")
+
+    if options.unix_socket:
+        listener = Listener(path=options.unix_socket, backlog=options.backlog)
+    else:
+        listener = Listener(host=options.host, port=options.port, backlog=options.backlog)
+
+    Server(
+        application,
+        listeners=[listener],
+        workers=options.workers,
+        cpu_affinity=options.cpu_affinity,
+        drain_timeout=options.drain_timeout
+    ).run()
 
 def main():
     args = sys.argv[1:]
@@ -7,8 +42,13 @@ def main():
         print(f"Zoe Framework {ZoeMetadata.version()}")
         return
 
+    if args and args[0] == "serve":
+        serve(args[1:])
+        return
+
     print("Zoe Framework CLI")
     print("Usage: python -m zoe [options]")
+    print("       python -m zoe serve module:app [--host HOST] [--port PORT] [--unix-socket PATH] [--workers N] [--cpu-affinity]")
 
 if __name__ == "__main__":
     main()
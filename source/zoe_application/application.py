@@ -2,17 +2,22 @@ from zoe_http.request import Request
 from zoe_http.response import Response
 from zoe_router.router import Router
 from zoe_router.router import Route, Routes, Router
+from zoe_router.route_tree import RouteTree
 from zoe_http.middleware import Middleware
 from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
 from zoe_exceptions.http_exceptions.exc_internal_exc import InternalServerException
 from zoe_exceptions.http_exceptions.exc_not_found import RouteNotFoundException
 
-from typing import get_type_hints
+from typing import Callable
 class App:
     def __init__(self: "App") -> None:
         self.__base_router: Router = Router(prefix="")
         self.__routers: list[Router] = [self.__base_router]
         self.__middlewares: list[Middleware] = []
+        # routes of every router compiled into one tree, tagged with the `Routes` generation it reflects
+        self.__compiled: tuple[int, RouteTree[tuple[Router, Route]]] | None = None
+        # the middleware chain, built on first use and again after a middleware is added
+        self.__pipeline: Callable[[Request], Response] | None = None
         self.__application_builtin_handlers()
 
 
@@ -24,33 +29,94 @@ class App:
               self.__base_router.add(route=route)
         elif isinstance(to_add, Router):
             self.__routers.append(to_add)
+            self.__compiled = None
         elif isinstance(to_add, Middleware):
             self.__middlewares.append(to_add)
+            self.__pipeline = None
         else:
             raise TypeError(f"Cannot register type '{type(to_add).__name__}'")
         return self
 
-    def _resolve(self, request: Request) -> Response:
-        def call_handler(req: Request) -> Response:
-            for router in self.__routers:
-                response = router.resolve(method=req.method, request=request)
-                if response is not None:
-                  return response
-            return RouteNotFoundException(request=request).to_response()
+    def _check_headers(self: "App", request: Request) -> Response | None:
+        """
+        Header phase, run by the server while the body is still on its way: the
+        `process_headers` hooks of the application middlewares, then of the
+        middlewares of the router serving the request. The first rejection goes
+        back out through the `process` of the middlewares in front of the one
+        that made it, so they log and decorate it as any other response.
+        """
+        try:
+            rejected = Router._run_header_hooks(middlewares=self.__middlewares, request=request)
+            if rejected is not None:
+                index, rejection = rejected
+                return self.__send_back(request=request, rejection=rejection, middlewares=self.__middlewares[:index])
+            if not any(router.router_middlewares for router in self.__routers):
+                return None
 
-        chain = call_handler # type: ignore
-        for middleware in reversed(self.__middlewares):
-            previous = chain
-            def chain(req, m=middleware, p=previous):
-                return m.process(req, p)
+            target, params, _ = self.__route_tree().match(path=request.route, method=request.method)
+            if target is None:
+                return None
+            router, _ = target
+            request.set_path_params(params)
+            rejected = Router._run_header_hooks(middlewares=router.router_middlewares, request=request)
+            if rejected is None:
+                return None
+            index, rejection = rejected
+            return self.__send_back(
+                request=request,
+                rejection=rejection,
+                middlewares=[*self.__middlewares, *router.router_middlewares[:index]]
+            )
+        except ZoeHttpException as exc:
+            return exc.to_response()
+        except Exception as exc:
+            return InternalServerException(detail=str(exc)).to_response()
+
+    @staticmethod
+    def __send_back(request: Request, rejection: Response, middlewares: list[Middleware]) -> Response:
+        # the middlewares in front already let the request through: their checks are not repeated
+        request._mark_headers_checked()
+        return Router._chain(middlewares=middlewares, final=lambda _: rejection)(request)
+
+    def _resolve(self, request: Request, headers_checked: bool = False) -> Response:
+        # `headers_checked`: the server already ran the header phase, the body was read after it
+        if headers_checked:
+            request._mark_headers_checked()
+
+        pipeline = self.__pipeline
+        if pipeline is None:
+            pipeline = Router._chain(middlewares=self.__middlewares, final=self.__call_handler)
+            self.__pipeline = pipeline
 
         try:
-            return chain(request)
+            return pipeline(request)
         except ZoeHttpException as exc:
             return exc.to_response()
         except Exception as exc:
             return InternalServerException(detail=str(exc)).to_response()
 
+    def __call_handler(self: "App", request: Request) -> Response:
+        target, params, allowed = self.__route_tree().match(path=request.route, method=request.method)
+        if target is None:
+            if allowed:
+                return Router._not_allowed(allowed=allowed)
+            return RouteNotFoundException().to_response()
+        router, route = target
+        request.set_path_params(params)
+        return router._dispatch(route=route, request=request)
+
+    def __route_tree(self: "App") -> RouteTree[tuple[Router, Route]]:
+        compiled = self.__compiled
+        generation = Routes._generation()
+        if compiled is None or compiled[0] != generation:
+            compiled = (generation, RouteTree.compile(
+                (router.prefix + route.endpoint, route.method, (router, route))
+                for router in self.__routers
+                for route in router.assigned_routes
+            ))
+            self.__compiled = compiled
+        return compiled[1]
+
     def __application_builtin_handlers(self: "App") -> None:
         from zoe_handlers.health_check_handler import HealthCheck
         from zoe_handlers.routes_handler import RoutesHandler
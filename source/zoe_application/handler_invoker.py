@@ -9,6 +9,64 @@ from zoe_di.container import Container, Box
 import typing
 import inspect
 
+class InvocationPlan:
+  """
+  How a handler's `handle()` is called, worked out once from its signature.
+  ---
+  Parameters typed with a `Model` receive the validated request body. The
+  others are looked up in the `Container` under their name, then under the
+  name of their type. Per request, only the validation and the container
+  lookups are left to do.
+  """
+  __slots__ = ("__handle", "__models", "__dependencies", "__takes_request")
+
+  def __init__(self: "InvocationPlan", handler: Handler) -> None:
+    self.__handle = handler.handle
+    self.__models: list[tuple[str, type[Model]]] = []
+    self.__dependencies: list[tuple[str, tuple[str, ...]]] = []
+
+    for param, class_reference in HandlerInvoker.get_hints(handler=handler).items():
+      if param in ("self", "request", "return"):
+        continue
+
+      if isinstance(class_reference, type) and Model.is_model(class_reference=class_reference):
+        self.__models.append((param, class_reference))
+        continue
+
+      type_name = getattr(class_reference, '__name__', None) or getattr(class_reference, '_name', None)
+      keys = (param, type_name) if type_name else (param,)
+      self.__dependencies.append((param, keys))
+
+    parameters = inspect.signature(handler.handle).parameters.values()
+    self.__takes_request = any(
+      p.name == "request" or p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters
+    )
+
+  def invoke(self: "InvocationPlan", request: Request) -> Response:
+    kwargs: dict = {}
+
+    for param, model_class in self.__models:
+      if request.body is None:
+        raise ZoeHttpException(
+          message=f"Request body is required but was not provided.",
+          status_code=HttpCode.BAD_REQUEST
+        )
+      try:
+        kwargs[param] = ModelEngine.validate_and_create(model_class=model_class, data=request.body)
+      except ZoeSchemaAggregateException as Zagexc:
+        return Zagexc.to_response(model_name=model_class.__name__)
+
+    for param, keys in self.__dependencies:
+      for key in keys:
+        if Container.has(key=key):
+          kwargs[param] = Container.resolve(key=key)
+          break
+
+    if self.__takes_request:
+      return self.__handle(request=request, **kwargs)
+    return self.__handle(**kwargs)
+
+
 class HandlerInvoker:
   @staticmethod
   def get_hints(handler: Handler) -> dict:
@@ -18,37 +76,10 @@ class HandlerInvoker:
       )
 
   @staticmethod
-  def resolve_kwargs(hints: dict, request: Request) -> dict | Response:
-      kwargs: dict = {}
-
-      for param, class_reference in hints.items():
-          if param in ("self", "request", "return"):
-              continue
-
-          if isinstance(class_reference, type) and Model.is_model(class_reference=class_reference):
-                if request.body is None:
-                    raise ZoeHttpException(
-                        message=f"Request body is required but was not provided.",
-                        status_code=HttpCode.BAD_REQUEST
-                    )
-                try:
-                    #param == body
-                    kwargs[param] = ModelEngine.validate_and_create(model_class=class_reference, data=request.body)
-                except ZoeSchemaAggregateException as Zagexc:
-                    return Zagexc.to_response(model_name=class_reference.__name__)
-
-          type_name = getattr(class_reference, '__name__', None) or getattr(class_reference, '_name', None)
-          if Container.has(key=param):
-              kwargs[param] = Container.resolve(key=param)
-          elif type_name and Container.has(key=type_name):
-              kwargs[param] = Container.resolve(key=type_name)
-
-      return kwargs
+  def plan(handler: Handler) -> InvocationPlan:
+    return InvocationPlan(handler=handler)
 
   @staticmethod
   def invoke(handler: Handler, request: Request) -> Response:
-    hints: dict = HandlerInvoker.get_hints(handler=handler)
-    kwargs: dict = HandlerInvoker.resolve_kwargs(hints=hints, request=request) # type: ignore
-    if isinstance(kwargs, Response):
-      return kwargs
-    return handler.handle(request=request, **kwargs)
+    # routes keep the plan of their handler: this one is worked out on every call
+    return HandlerInvoker.plan(handler=handler).invoke(request=request)
@@ -1,9 +1,17 @@
 from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
+from zoe_http.response import Response
 from zoe_http.code import HttpCode
 
 class MethodNotAllowedException(ZoeHttpException):
-    def __init__(self, route: str, method: str) -> None:
+    # same body for every route and method: serialized once
+    __MESSAGE = "Method not allowed."
+    __RESPONSE = ZoeHttpException(message=__MESSAGE, status_code=HttpCode.METHOD_NOT_ALLOWED).to_response()._freeze()
+
+    def __init__(self) -> None:
         super().__init__(
-            message=f"Method '{method}' is not allowed for '{route}'.",
+            message=self.__MESSAGE,
             status_code=HttpCode.METHOD_NOT_ALLOWED
-        )
\ No newline at end of file
+        )
+
+    def to_response(self) -> Response:
+        return self.__RESPONSE._copy()
@@ -1,10 +1,22 @@
 from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
 from zoe_http.request import Request
+from zoe_http.response import Response
 from zoe_http.code import HttpCode
 
 class RouteNotFoundException(ZoeHttpException):
-    def __init__(self: "RouteNotFoundException", request: Request) -> None:
+    # without a request the body does not echo the path, so every such 404 is
+    # the same bytes, serialized once: unknown-path scans cost no encoding
+    __MESSAGE = "Route not found."
+    __RESPONSE = ZoeHttpException(message=__MESSAGE, status_code=HttpCode.NOT_FOUND).to_response()._freeze()
+
+    def __init__(self: "RouteNotFoundException", request: Request | None = None) -> None:
         super().__init__(
-            message=f"Route '{request.route}' not found for method {request.method.name}",
+            message=self.__MESSAGE if request is None else f"Route '{request.route}' not found for method {request.method.name}",
             status_code=HttpCode.NOT_FOUND
-        )
\ No newline at end of file
+        )
+        self.__generic = request is None
+
+    def to_response(self: "RouteNotFoundException") -> Response:
+        if self.__generic:
+            return self.__RESPONSE._copy()
+        return super().to_response()
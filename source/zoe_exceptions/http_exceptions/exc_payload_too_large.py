@@ -0,0 +1,9 @@
+from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
+from zoe_http.code import HttpCode
+
+class PayloadTooLargeException(ZoeHttpException):
+    def __init__(self, max_size: int) -> None:
+        super().__init__(
+            message=f"Payload too large. Maximum allowed size is {max_size} bytes",
+            status_code=HttpCode.PAYLOAD_TOO_LARGE
+        )
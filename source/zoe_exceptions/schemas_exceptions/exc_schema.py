@@ -0,0 +1,5 @@
+class SchemaError(TypeError):
+    """
+    A `Model` class that cannot be defined. Raised when the class is created,
+    not when a request is validated.
+    """
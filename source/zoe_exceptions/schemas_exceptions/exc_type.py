@@ -3,15 +3,17 @@ from zoe_exceptions.schemas_exceptions.exc_base import ErrorCode
 
 class SchemaTypeError(ZoeSchemaException):
     def __init__(self, field_name: str, expected: type, actual: type):
+        # unions such as `int | None` have no __name__
+        expected_name = getattr(expected, "__name__", None) or str(expected)
         super().__init__(
             field_name=field_name,
             message=(
-                f"Field '{field_name}' expects type '{expected.__name__}', "
+                f"Field '{field_name}' expects type '{expected_name}', "
                 f"but received '{actual.__name__}'."
             ),
             error_code=ErrorCode.TYPE_MISMATCH,
             details={
-                "expected_type": expected.__name__,
+                "expected_type": expected_name,
                 "received_type": actual.__name__
             }
         )
@@ -0,0 +1,11 @@
+from zoe_http.handler import Handler
+from zoe_http.response import Response
+from zoe_http.request import Request
+
+class ConstantHandler(Handler):
+    """Serves a response serialized once, when its route was declared (see `Route.constant`)."""
+    def __init__(self: "ConstantHandler", response: Response) -> None:
+        self.__response = response._freeze()
+
+    def handle(self: "ConstantHandler", request: Request) -> Response:
+        return self.__response._copy()
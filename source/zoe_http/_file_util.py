@@ -1,4 +1,9 @@
 from pathlib import Path
+from typing import BinaryIO
+import errno
+import io
+import os
+import socket
 
 class FileUtil:
     @staticmethod
@@ -24,10 +29,51 @@ class FileUtil:
                     return None
                 current = parent
 
-    @staticmethod
-    def read(path: Path) -> bytes | None:
+
+class FileRegion:
+    """
+    A byte range of an open file, yielded by a response body instead of bytes so
+    the server can hand it to `os.sendfile()` (zero-copy where the platform
+    supports it, chunked reads otherwise). When `os.sendfile()` refuses the
+    pair of descriptors, e.g. a socket that is not a plain TCP/Unix one or a
+    file that cannot be mapped, the region carries on with chunked reads.
+    """
+    __FALLBACK_CHUNK_SIZE = 64 * 1024
+    # errors of `os.sendfile()` meaning it cannot serve this pair of descriptors at all
+    __UNSUPPORTED = frozenset({errno.EINVAL, errno.ENOTSOCK, errno.EOPNOTSUPP, errno.ENOSYS, errno.ESPIPE})
+
+    def __init__(self: "FileRegion", file: BinaryIO, offset: int, count: int) -> None:
+        self.file = file
+        self.offset = offset
+        self.count = count
+        self.__zero_copy = hasattr(os, "sendfile")
+
+    def send_some(self: "FileRegion", conn_socket: socket.socket) -> int:
+        """
+        Sends as much of the region as the socket takes and advances past it.
+        Raises `BlockingIOError` when a non-blocking socket is full.
+        """
+        if not self.count:
+            return 0
+        sent = self.__send_file(conn_socket=conn_socket) if self.__zero_copy else None
+        if sent is None:
+            self.file.seek(self.offset)
+            sent = conn_socket.send(self.file.read(min(self.count, self.__FALLBACK_CHUNK_SIZE)))
+        if not sent:
+            raise EOFError("file is shorter than the region being sent.")
+        self.offset += sent
+        self.count -= sent
+        return sent
+
+    def __send_file(self: "FileRegion", conn_socket: socket.socket) -> int | None:
+        """`os.sendfile()` of the region, or `None` once it turned out not to work here."""
         try:
-            with open(path, "rb") as f:
-                return f.read()
-        except FileNotFoundError:
+            return os.sendfile(conn_socket.fileno(), self.file.fileno(), self.offset, self.count)
+        except BlockingIOError:
+            raise
+        except OSError as exc:
+            # `io.UnsupportedOperation`: a file object without a descriptor
+            if not isinstance(exc, io.UnsupportedOperation) and exc.errno not in self.__UNSUPPORTED:
+                raise
+            self.__zero_copy = False
             return None
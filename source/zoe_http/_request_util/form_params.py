@@ -1,6 +1,24 @@
 from typing import Any
 
+from zoe_http._request_util.upload_file import UploadFile
+
 class FormParams(dict):
+    """
+    Fields of a form body. Text fields map to `str`, file fields to `UploadFile`;
+    a repeated field maps to its last value, see `get_all()`.
+    """
+    def __init__(self: "FormParams", *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.__values: dict[str, list[str | UploadFile]] = {key: [value] for key, value in self.items()}
+
+    def get_all(self: "FormParams", key: str) -> list[str | UploadFile]:
+        """Every value sent for `key`, in order (e.g. several files of one `<input multiple>`)."""
+        return list(self.__values.get(key, []))
+
+    def _add(self: "FormParams", key: str, value: str | UploadFile) -> None:
+        self[key] = value
+        self.__values.setdefault(key, []).append(value)
+
     def __getattr__(self: "FormParams", key: str) -> str:
         return self.get(key) #type: ignore
 
@@ -0,0 +1,223 @@
+from email.message import Message
+from email.utils import collapse_rfc2231_value
+from urllib.parse import unquote_to_bytes
+
+from zoe_http._request_util.form_params import FormParams
+from zoe_http._request_util.upload_file import UploadFile
+from zoe_exceptions.http_exceptions.exc_malformed_request import MalformedRequestException
+from zoe_exceptions.http_exceptions.exc_payload_too_large import PayloadTooLargeException
+
+class UrlencodedParser:
+    """
+    Incremental `application/x-www-form-urlencoded` parser.
+    ---
+    Pieces of the body are passed to `feed()` as they arrive; only the field
+    being received is buffered, and no field may exceed `max_field_size`.
+    """
+    _MAX_FIELD_SIZE: int = 1024 * 1024
+
+    def __init__(self: "UrlencodedParser", charset: str = "utf-8", max_field_size: int = _MAX_FIELD_SIZE) -> None:
+        self.__charset = charset
+        self.__max_field_size = max_field_size
+        self.__pending = bytearray()
+        self.__params = FormParams()
+
+    def feed(self: "UrlencodedParser", data: bytes | bytearray | memoryview) -> None:
+        self.__pending += data
+        *fields, rest = self.__pending.split(b"&")
+        for field in fields:
+            self.__add(field)
+        if len(rest) > self.__max_field_size:
+            raise PayloadTooLargeException(max_size=self.__max_field_size)
+        self.__pending = bytearray(rest)
+
+    def close(self: "UrlencodedParser") -> FormParams:
+        self.__add(self.__pending)
+        self.__pending = bytearray()
+        return self.__params
+
+    def discard(self: "UrlencodedParser") -> None:
+        """Drops what was parsed, when the body turned out to be unusable."""
+        self.__pending = bytearray()
+        self.__params = FormParams()
+
+    def __add(self: "UrlencodedParser", field: bytes | bytearray) -> None:
+        if not field:
+            return
+        key, _, value = field.replace(b"+", b" ").partition(b"=")
+        try:
+            self.__params._add(
+                unquote_to_bytes(bytes(key)).decode(self.__charset),
+                unquote_to_bytes(bytes(value)).decode(self.__charset)
+            )
+        except (UnicodeDecodeError, LookupError):
+            raise MalformedRequestException(f"form field is not valid '{self.__charset}' text.")
+
+
+class MultipartParser:
+    """
+    Incremental `multipart/form-data` parser.
+    ---
+    Pieces of the body are passed to `feed()` as they arrive. Text fields are
+    collected into `FormParams` (at most `max_field_size` bytes each), file
+    parts are written straight into a spooled `UploadFile`, so memory stays
+    bounded whatever the size of the parts. When the body is rejected the
+    uploads are closed before the error propagates.
+    """
+    _MAX_FIELD_SIZE: int = 1024 * 1024
+    _MAX_PART_HEADER_SIZE: int = 16 * 1024
+    _MAX_PARTS: int = 1000
+
+    __PREAMBLE = 0
+    __HEADERS = 1
+    __BODY = 2
+    __AFTER_DELIMITER = 3
+    __DONE = 4
+
+    def __init__(self: "MultipartParser", boundary: str, max_field_size: int = _MAX_FIELD_SIZE) -> None:
+        if not boundary or len(boundary) > 70:
+            raise MalformedRequestException("multipart body has no valid boundary.")
+        self.__first_delimiter = b"--" + boundary.encode("latin-1")
+        self.__delimiter = b"\r\n" + self.__first_delimiter
+        self.__max_field_size = max_field_size
+        self.__buffer = bytearray()
+        self.__state = self.__PREAMBLE
+        self.__parts = 0
+        self.__params = FormParams()
+
+        self.__name = ""
+        self.__file: UploadFile | None = None
+        self.__text = bytearray()
+
+    def feed(self: "MultipartParser", data: bytes | bytearray | memoryview) -> None:
+        self.__buffer += data
+        try:
+            while self.__step():
+                pass
+        except BaseException:
+            self.discard()
+            raise
+
+    def close(self: "MultipartParser") -> FormParams:
+        if self.__state != self.__DONE:
+            self.discard()
+            raise MalformedRequestException("multipart body ended before its closing boundary.")
+        return self.__params
+
+    def discard(self: "MultipartParser") -> None:
+        """
+        Closes the uploads received so far, the one being written included: a
+        body that failed to parse must not leave temporary files behind.
+        """
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        for values in (self.__params.get_all(key) for key in self.__params):
+            for value in values:
+                if isinstance(value, UploadFile):
+                    value.close()
+        self.__params = FormParams()
+        self.__buffer.clear()
+        self.__text = bytearray()
+
+    def __step(self: "MultipartParser") -> bool:
+        """Advances the state machine over the buffer. Returns whether it can go on without more data."""
+        buffer = self.__buffer
+
+        if self.__state == self.__PREAMBLE:
+            index = buffer.find(self.__first_delimiter)
+            if index < 0:
+                # keep what could be the start of a delimiter cut in half
+                del buffer[:max(0, len(buffer) - len(self.__first_delimiter) + 1)]
+                return False
+            del buffer[:index + len(self.__first_delimiter)]
+            self.__state = self.__AFTER_DELIMITER
+            return True
+
+        if self.__state == self.__AFTER_DELIMITER:
+            if len(buffer) < 2:
+                return False
+            if buffer[:2] == b"--":
+                self.__state = self.__DONE
+                buffer.clear()
+                return False
+            if buffer[:2] != b"\r\n":
+                raise MalformedRequestException("multipart delimiter is not followed by CRLF.")
+            del buffer[:2]
+            self.__state = self.__HEADERS
+            return True
+
+        if self.__state == self.__HEADERS:
+            index = buffer.find(b"\r\n\r\n")
+            if index < 0:
+                if len(buffer) > self._MAX_PART_HEADER_SIZE:
+                    raise PayloadTooLargeException(max_size=self._MAX_PART_HEADER_SIZE)
+                return False
+            self.__start_part(raw_headers=bytes(buffer[:index]))
+            del buffer[:index + 4]
+            self.__state = self.__BODY
+            return True
+
+        if self.__state == self.__BODY:
+            index = buffer.find(self.__delimiter)
+            if index < 0:
+                safe = len(buffer) - len(self.__delimiter) + 1
+                if safe > 0:
+                    self.__write(buffer[:safe])
+                    del buffer[:safe]
+                return False
+            self.__write(buffer[:index])
+            del buffer[:index + len(self.__delimiter)]
+            self.__end_part()
+            self.__state = self.__AFTER_DELIMITER
+            return True
+
+        # epilogue after the closing delimiter is ignored
+        buffer.clear()
+        return False
+
+    def __start_part(self: "MultipartParser", raw_headers: bytes) -> None:
+        self.__parts += 1
+        if self.__parts > self._MAX_PARTS:
+            raise MalformedRequestException(f"multipart body has more than {self._MAX_PARTS} parts.")
+
+        headers = Message()
+        for line in raw_headers.decode("utf-8", errors="replace").split("\r\n"):
+            key, separator, value = line.partition(":")
+            if separator:
+                headers[key.strip()] = value.strip()
+
+        name = headers.get_param("name", header="content-disposition")
+        if name is None:
+            raise MalformedRequestException("multipart part has no field name.")
+        name = collapse_rfc2231_value(name)
+        filename = headers.get_filename()
+
+        self.__name = name
+        self.__text = bytearray()
+        self.__file = None
+        if filename is not None:
+            self.__file = UploadFile(
+                field_name=name,
+                filename=filename,
+                content_type=headers.get("Content-Type", "application/octet-stream")
+            )
+
+    def __write(self: "MultipartParser", data: bytearray) -> None:
+        if not data:
+            return
+        if self.__file is not None:
+            self.__file._write(data)
+            return
+        if len(self.__text) + len(data) > self.__max_field_size:
+            raise PayloadTooLargeException(max_size=self.__max_field_size)
+        self.__text += data
+
+    def __end_part(self: "MultipartParser") -> None:
+        if self.__file is not None:
+            self.__file._seal()
+            self.__params._add(self.__name, self.__file)
+        else:
+            self.__params._add(self.__name, self.__text.decode("utf-8", errors="replace"))
+        self.__file = None
+        self.__text = bytearray()
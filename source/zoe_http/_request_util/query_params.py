@@ -1,6 +1,24 @@
 from typing import Any
+from urllib.parse import parse_qsl
 
 class QueryParams(dict):
+    def __init__(self: "QueryParams", *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.__values: dict[str, list[str]] = {key: [value] for key, value in self.items()}
+
+    @classmethod
+    def parse(cls, query_string: str) -> "QueryParams":
+        """Parses a query string; a repeated key maps to its last value, see `get_all()`."""
+        params = cls()
+        for key, value in parse_qsl(query_string, keep_blank_values=True):
+            params[key] = value
+            params.__values.setdefault(key, []).append(value)
+        return params
+
+    def get_all(self: "QueryParams", key: str) -> list[str]:
+        """Every value sent for `key`, in order (`?tag=a&tag=b` → `["a", "b"]`)."""
+        return list(self.__values.get(key, []))
+
     def __getattr__(self: "QueryParams", key: str) -> str:
         return self.get(key) #type: ignore
 
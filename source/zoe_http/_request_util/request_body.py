@@ -0,0 +1,98 @@
+import mmap
+import tempfile
+from typing import IO, Iterator
+
+class RequestBody:
+    """
+    A request body that is read from the connection on demand.
+    ---
+    `source` yields the body pieces as they come off the socket. The body is
+    either streamed once with `stream()`, or buffered with `read()`: in memory
+    up to `spool_threshold` bytes, past it in an anonymous temporary file that
+    is mapped back read-only, so a large upload never lands in the Python heap.
+    """
+    __slots__ = (
+        "__pieces", "__spool_threshold", "__view", "__spool",
+        "__consumed", "__complete", "__size"
+    )
+
+    _CHUNK_SIZE: int = 64 * 1024
+    _DEFAULT_MAX_DISCARD: int = 256 * 1024
+
+    def __init__(self: "RequestBody", source: Iterator[bytes], spool_threshold: int) -> None:
+        self.__pieces = self.__track(source)
+        self.__spool_threshold = spool_threshold
+        self.__view: memoryview | None = None
+        self.__spool: IO[bytes] | None = None
+        self.__consumed = False
+        self.__complete = False
+        self.__size = 0
+
+    @property
+    def size(self: "RequestBody") -> int:
+        """Bytes read off the connection so far."""
+        return self.__size
+
+    @property
+    def complete(self: "RequestBody") -> bool:
+        """Whether the whole body has been read off the connection."""
+        return self.__complete
+
+    def stream(self: "RequestBody") -> Iterator[bytes]:
+        if self.__view is not None:
+            view = self.__view
+            for start in range(0, len(view), self._CHUNK_SIZE):
+                yield bytes(view[start:start + self._CHUNK_SIZE])
+            return
+        if self.__consumed:
+            raise RuntimeError("The request body can only be streamed once.")
+        self.__consumed = True
+        yield from self.__pieces
+
+    def read(self: "RequestBody") -> memoryview:
+        if self.__view is None:
+            if self.__consumed:
+                raise RuntimeError("The request body was already streamed.")
+            self.__consumed = True
+            self.__view = self.__buffer()
+        return self.__view
+
+    def finish(self: "RequestBody", max_discard: int = _DEFAULT_MAX_DISCARD) -> bool:
+        """
+        Discards what the application left unread, up to `max_discard` bytes.
+        Returns whether the body was read to its end, i.e. whether the
+        connection can carry another request.
+        """
+        discarded = 0
+        try:
+            for piece in self.__pieces:
+                discarded += len(piece)
+                if discarded > max_discard:
+                    return False
+        except Exception:
+            return False
+        return self.__complete
+
+    def __track(self: "RequestBody", source: Iterator[bytes]) -> Iterator[bytes]:
+        for piece in source:
+            self.__size += len(piece)
+            yield piece
+        self.__complete = True
+
+    def __buffer(self: "RequestBody") -> memoryview:
+        buffer = bytearray()
+        for piece in self.__pieces:
+            if self.__spool is None and len(buffer) + len(piece) > self.__spool_threshold:
+                self.__spool = tempfile.TemporaryFile()
+                self.__spool.write(buffer)
+                buffer = bytearray()
+            if self.__spool is not None:
+                self.__spool.write(piece)
+            else:
+                buffer += piece
+
+        if self.__spool is None:
+            return memoryview(buffer)
+        self.__spool.flush()
+        # the mapping holds its own descriptor: it outlives the temporary file
+        return memoryview(mmap.mmap(self.__spool.fileno(), 0, access=mmap.ACCESS_READ))
@@ -0,0 +1,49 @@
+from collections.abc import Mapping
+from typing import Iterator
+
+class Headers(Mapping[str, str]):
+    """
+    Case-insensitive, read-only view of the request headers.
+    ---
+    Wraps the header list produced by the parser; the lookup table is only
+    built the first time a header is read. A header sent more than once is
+    joined with `", "` — `get_all()` returns the individual values.
+    """
+    __slots__ = ("__raw", "__index")
+
+    def __init__(self: "Headers", raw: list[tuple[str, str]]) -> None:
+        self.__raw = raw
+        self.__index: dict[str, str] | None = None
+
+    def __lookup(self: "Headers") -> dict[str, str]:
+        if self.__index is None:
+            index: dict[str, str] = {}
+            for key, value in self.__raw:
+                lowered = key.lower()
+                index[lowered] = f"{index[lowered]}, {value}" if lowered in index else value
+            self.__index = index
+        return self.__index
+
+    def __getitem__(self: "Headers", key: str) -> str:
+        return self.__lookup()[key.lower()]
+
+    def __contains__(self: "Headers", key: object) -> bool:
+        return isinstance(key, str) and key.lower() in self.__lookup()
+
+    def __iter__(self: "Headers") -> Iterator[str]:
+        seen: set[str] = set()
+        for key, _ in self.__raw:
+            lowered = key.lower()
+            if lowered not in seen:
+                seen.add(lowered)
+                yield key
+
+    def __len__(self: "Headers") -> int:
+        return len(self.__lookup())
+
+    def __repr__(self: "Headers") -> str:
+        return f"Headers({dict(self.items())!r})"
+
+    def get_all(self: "Headers", key: str) -> list[str]:
+        lowered = key.lower()
+        return [value for name, value in self.__raw if name.lower() == lowered]
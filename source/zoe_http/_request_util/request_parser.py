@@ -0,0 +1,267 @@
+from zoe_exceptions.http_exceptions.exc_malformed_request import MalformedRequestException
+from zoe_exceptions.http_exceptions.exc_payload_too_large import PayloadTooLargeException
+from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
+from zoe_http.code import HttpCode
+
+class RequestHead:
+    def __init__(self: "RequestHead", method: str, target: str, http_version: str, headers: list[tuple[str, str]]) -> None:
+        self.method = method
+        self.target = target
+        self.http_version = http_version
+        self.headers = headers
+        self.content_length: int = self.__content_length()
+        self.chunked: bool = self.__is_chunked()
+
+    def header(self: "RequestHead", name: str, default: str | None = None) -> str | None:
+        lowered = name.lower()
+        for key, value in self.headers:
+            if key.lower() == lowered:
+                return value
+        return default
+
+    @property
+    def keep_alive(self: "RequestHead") -> bool:
+        connection = self.header("Connection")
+        if connection is not None:
+            return "keep-alive" in connection.lower()
+        return self.http_version == "HTTP/1.1"
+
+    @property
+    def has_body(self: "RequestHead") -> bool:
+        return self.chunked or self.content_length > 0
+
+    @property
+    def expects_continue(self: "RequestHead") -> bool:
+        # HTTP/1.0 clients cannot understand an interim response (RFC 9110 §10.1.1)
+        expect = self.header("Expect")
+        return expect is not None and expect.lower() == "100-continue" and self.http_version == "HTTP/1.1"
+
+    def __is_chunked(self: "RequestHead") -> bool:
+        value = self.header("Transfer-Encoding")
+        if value is None:
+            return False
+        codings = [coding.strip().lower() for coding in value.split(",")]
+        if codings[-1] != "chunked":
+            raise MalformedRequestException(f"unsupported Transfer-Encoding '{value}'.")
+        if len(codings) > 1:
+            raise ZoeHttpException(
+                message=f"Transfer-Encoding '{value}' is not implemented.",
+                status_code=HttpCode.NOT_IMPLEMENTED
+            )
+        return True
+
+    def __content_length(self: "RequestHead") -> int:
+        value = self.header("Content-Length")
+        if value is None:
+            return 0
+        try:
+            length = int(value)
+        except ValueError:
+            raise MalformedRequestException(f"Content-Length '{value}' is not a valid integer.")
+        if length < 0:
+            raise MalformedRequestException(f"Content-Length '{value}' cannot be negative.")
+        return length
+
+
+class RequestParser:
+    """
+    Incremental HTTP/1.1 request parser working directly on bytes.
+    ---
+    Bytes received from the connection are appended with `feed()`. `parse_head()`
+    looks for the end of the header block only in the bytes that arrived since the
+    last call, and parses the request line and headers exactly once. The body is
+    never decoded here: it is taken as raw bytes with `take_into()` / `take()`, and
+    whatever is left in the buffer belongs to the next request on the connection.
+    """
+    __HEAD_TERMINATOR = b"\r\n\r\n"
+
+    def __init__(self: "RequestParser", max_head_size: int) -> None:
+        self.__buffer = bytearray()
+        self.__scanned = 0
+        self.__max_head_size = max_head_size
+        self.__pending_head: RequestHead | None = None
+        self.__pending_error: ZoeHttpException | None = None
+
+    @property
+    def buffered(self: "RequestParser") -> int:
+        return len(self.__buffer)
+
+    def feed(self: "RequestParser", data: bytes | bytearray | memoryview) -> None:
+        self.__buffer += data
+
+    def parse_head(self: "RequestParser") -> RequestHead | None:
+        if self.__pending_error is not None:
+            error, self.__pending_error = self.__pending_error, None
+            raise error
+        if self.__pending_head is not None:
+            head, self.__pending_head = self.__pending_head, None
+            return head
+        return self.__next_head()
+
+    def peek_head(self: "RequestParser") -> RequestHead | None:
+        """The next request head if it is already buffered. It stays pending for `parse_head()`."""
+        if self.__pending_head is None and self.__pending_error is None:
+            try:
+                self.__pending_head = self.__next_head()
+            except ZoeHttpException as exc:
+                self.__pending_error = exc
+        return self.__pending_head
+
+    def has_complete_request(self: "RequestParser") -> bool:
+        """Whether a whole request (head and body) is already buffered, without reading more."""
+        head = self.peek_head()
+        if self.__pending_error is not None:
+            return True
+        if head is None or head.chunked:
+            return False
+        return len(self.__buffer) >= head.content_length
+
+    def __next_head(self: "RequestParser") -> RequestHead | None:
+        self.__skip_leading_crlf()
+
+        # the terminator may straddle the previous chunk boundary
+        start = max(0, self.__scanned - len(self.__HEAD_TERMINATOR) + 1)
+        end = self.__buffer.find(self.__HEAD_TERMINATOR, start)
+
+        if end == -1:
+            self.__scanned = len(self.__buffer)
+            if self.__scanned > self.__max_head_size:
+                raise MalformedRequestException("request head is too large.")
+            return None
+
+        raw_head = bytes(self.__buffer[:end])
+        del self.__buffer[:end + len(self.__HEAD_TERMINATOR)]
+        self.__scanned = 0
+
+        return self.__parse_head(raw_head=raw_head)
+
+    def take_into(self: "RequestParser", view: memoryview) -> int:
+        n = min(len(view), len(self.__buffer))
+        if n:
+            view[:n] = self.__buffer[:n]
+            del self.__buffer[:n]
+        return n
+
+    def take(self: "RequestParser", n: int) -> bytes:
+        data = bytes(self.__buffer[:n])
+        del self.__buffer[:n]
+        return data
+
+    def take_line(self: "RequestParser", max_length: int) -> bytes | None:
+        end = self.__buffer.find(b"\r\n", 0, max_length + 2)
+        if end == -1:
+            if len(self.__buffer) > max_length:
+                raise MalformedRequestException("line is too long.")
+            return None
+        line = bytes(self.__buffer[:end])
+        del self.__buffer[:end + 2]
+        return line
+
+    def __skip_leading_crlf(self: "RequestParser") -> None:
+        # RFC 9112 §2.2: ignore empty lines received before the request line
+        skip = 0
+        while self.__buffer[skip:skip + 2] == b"\r\n":
+            skip += 2
+        if skip:
+            del self.__buffer[:skip]
+            self.__scanned = max(0, self.__scanned - skip)
+
+    def __parse_head(self: "RequestParser", raw_head: bytes) -> RequestHead:
+        lines = raw_head.decode("utf-8", errors="replace").split("\r\n")
+
+        request_line = lines[0].split(" ")
+        if len(request_line) != 3 or not all(request_line):
+            raise MalformedRequestException("invalid request line format.")
+        method, target, http_version = request_line
+
+        headers: list[tuple[str, str]] = []
+        for line in lines[1:]:
+            name, separator, value = line.partition(":")
+            if not separator or not name.strip():
+                raise MalformedRequestException(f"invalid header line '{line}'.")
+            headers.append((name.strip(), value.strip()))
+
+        return RequestHead(method=method, target=target, http_version=http_version, headers=headers)
+
+
+class ChunkedDecoder:
+    """
+    Incremental decoder for `Transfer-Encoding: chunked` request bodies.
+    ---
+    Reads chunk framing out of a `RequestParser` buffer and hands back the decoded
+    bytes piece by piece, so a body of unknown length never has to be buffered
+    whole. The total decoded size is capped by `max_size` (`413` past it).
+    """
+    __MAX_LINE_LENGTH = 4096
+    __HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+    __SIZE = 0
+    __DATA = 1
+    __DATA_END = 2
+    __TRAILERS = 3
+    __DONE = 4
+
+    def __init__(self: "ChunkedDecoder", parser: RequestParser, max_size: int) -> None:
+        self.__parser = parser
+        self.__max_size = max_size
+        self.__state = self.__SIZE
+        self.__remaining = 0
+        self.__decoded = 0
+
+    @property
+    def done(self: "ChunkedDecoder") -> bool:
+        return self.__state == self.__DONE
+
+    @property
+    def decoded(self: "ChunkedDecoder") -> int:
+        return self.__decoded
+
+    def read(self: "ChunkedDecoder", limit: int) -> bytes | None:
+        """
+        Returns the next decoded piece (at most `limit` bytes) from what is buffered,
+        `b""` once the last chunk and trailers were consumed, or `None` when more
+        bytes must be fed to the parser first.
+        """
+        parser = self.__parser
+        while True:
+            if self.__state == self.__DATA:
+                if not parser.buffered:
+                    return None
+                piece = parser.take(min(self.__remaining, limit))
+                self.__remaining -= len(piece)
+                if not self.__remaining:
+                    self.__state = self.__DATA_END
+                return piece
+
+            if self.__state == self.__DONE:
+                return b""
+
+            line = parser.take_line(max_length=self.__MAX_LINE_LENGTH)
+            if line is None:
+                return None
+
+            if self.__state == self.__SIZE:
+                self.__start_chunk(size_line=line)
+            elif self.__state == self.__DATA_END:
+                if line:
+                    raise MalformedRequestException("chunk data is not followed by CRLF.")
+                self.__state = self.__SIZE
+            elif not line:
+                # trailer fields are accepted but ignored
+                self.__state = self.__DONE
+
+    def __start_chunk(self: "ChunkedDecoder", size_line: bytes) -> None:
+        size_part = size_line.split(b";", 1)[0].strip()
+        if not size_part or size_part.strip(self.__HEX_DIGITS):
+            raise MalformedRequestException(f"invalid chunk size '{size_part.decode('latin-1')}'.")
+        size = int(size_part, 16)
+
+        if size == 0:
+            self.__state = self.__TRAILERS
+            return
+
+        self.__decoded += size
+        if self.__decoded > self.__max_size:
+            raise PayloadTooLargeException(max_size=self.__max_size)
+        self.__remaining = size
+        self.__state = self.__DATA
@@ -0,0 +1,69 @@
+import shutil
+import tempfile
+from typing import Iterator
+
+class UploadFile:
+    """
+    A file sent in a `multipart/form-data` request.
+    ---
+    The content is spooled while the request is parsed: kept in memory up to
+    1 MB, in a temporary file past it, so an upload of any size costs bounded
+    memory. Read it with `read()` / `stream()` or copy it with `save()`.
+    """
+    __slots__ = ("__field_name", "__filename", "__content_type", "__file", "__size")
+
+    _SPOOL_SIZE: int = 1024 * 1024
+    _CHUNK_SIZE: int = 64 * 1024
+
+    def __init__(self: "UploadFile", field_name: str, filename: str, content_type: str) -> None:
+        self.__field_name = field_name
+        self.__filename = filename
+        self.__content_type = content_type
+        self.__file = tempfile.SpooledTemporaryFile(max_size=self._SPOOL_SIZE)
+        self.__size = 0
+
+    @property
+    def field_name(self: "UploadFile") -> str:
+        return self.__field_name
+
+    @property
+    def filename(self: "UploadFile") -> str:
+        return self.__filename
+
+    @property
+    def content_type(self: "UploadFile") -> str:
+        return self.__content_type
+
+    @property
+    def size(self: "UploadFile") -> int:
+        return self.__size
+
+    @property
+    def file(self: "UploadFile") -> tempfile.SpooledTemporaryFile:
+        return self.__file
+
+    def read(self: "UploadFile", size: int = -1) -> bytes:
+        return self.__file.read(size)
+
+    def stream(self: "UploadFile") -> Iterator[bytes]:
+        self.__file.seek(0)
+        while chunk := self.__file.read(self._CHUNK_SIZE):
+            yield chunk
+
+    def save(self: "UploadFile", path: str) -> None:
+        self.__file.seek(0)
+        with open(path, "wb") as destination:
+            shutil.copyfileobj(self.__file, destination, self._CHUNK_SIZE)
+
+    def close(self: "UploadFile") -> None:
+        self.__file.close()
+
+    def _write(self: "UploadFile", data: bytes | bytearray | memoryview) -> None:
+        self.__file.write(data)
+        self.__size += len(data)
+
+    def _seal(self: "UploadFile") -> None:
+        self.__file.seek(0)
+
+    def __repr__(self: "UploadFile") -> str:
+        return f"UploadFile(filename={self.__filename!r}, content_type={self.__content_type!r}, size={self.__size})"
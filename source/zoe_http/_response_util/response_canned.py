@@ -0,0 +1,62 @@
+from zoe_http.response import Response
+from zoe_http.code import HttpCode
+from zoe_http._response_util.response_head import ResponseHead
+
+class Canned(Response):
+  """
+  A response serialized ahead of time by `Response._freeze()`.
+  ---
+  `fields` and `body` are shared, never copied, by every `_copy()`: a send
+  only writes the status line, `Date` and the headers added to the copy
+  (e.g. `Connection`) around them. A header added to a copy replaces the
+  frozen field of the same name.
+  """
+  def __init__(
+          self: "Canned",
+          http_code: HttpCode,
+          fields: bytes,
+          body: bytes,
+          dated: bool = True,
+          names: frozenset[str] | None = None
+    ) -> None:
+    super().__init__(http_code=http_code)
+    self.__fields = fields
+    self.__body = body
+    self.__dated = dated
+    # lower-cased names of the frozen fields, worked out once and shared by the copies
+    self.__names = names if names is not None else frozenset(
+      Canned.__name_of(line) for line in fields.split(b"\r\n") if line
+    )
+
+  def _copy(self: "Canned") -> "Canned":
+    return Canned(
+      http_code=self.status_code,
+      fields=self.__fields,
+      body=self.__body,
+      dated=self.__dated,
+      names=self.__names
+    )
+
+  def _parts(self: "Canned") -> tuple[bytes, bytes]:
+    return self.__fields, self.__body
+
+  def _build(self: "Canned") -> bytes:
+    added = self._header_names()
+    fields = self.__fields
+    if not added.isdisjoint(self.__names):
+      fields = b"".join(
+        line + b"\r\n" for line in fields.split(b"\r\n")
+        if line and Canned.__name_of(line) not in added
+      )
+    return b"".join((
+      ResponseHead.status_line(self.status_code),
+      ResponseHead.date_line() if self.__dated and "date" not in added else b"",
+      fields,
+      self._header_lines(),
+      b"\r\n",
+      self.__body
+    ))
+
+  @staticmethod
+  def __name_of(line: bytes) -> str:
+    return line.split(b":", 1)[0].strip().lower().decode("latin-1")
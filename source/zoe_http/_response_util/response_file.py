@@ -1,7 +1,12 @@
 from zoe_http.response import Response
 from zoe_http.code import HttpCode
 import mimetypes
-from zoe_http._file_util import FileUtil
+import os
+import secrets
+from email.utils import formatdate
+from typing import BinaryIO, Iterator
+from zoe_http._file_util import FileUtil, FileRegion
+from zoe_exceptions.http_exceptions.exc_resource_not_found import NotFoundException
 
 class File(Response):
   __INLINE_TYPES = {
@@ -11,6 +16,7 @@ class File(Response):
     "video/mp4", "video/webm",
     "audio/mpeg", "audio/ogg",
   }
+  __MAX_RANGES = 16
 
   def __init__(
           self,
@@ -21,29 +27,161 @@ class File(Response):
           headers: dict | None = None,
     ) -> None:
     super().__init__(http_code=http_code, headers=headers)
-    self._content_type = mimetypes.guess_type(filename) or "application/octet-stream"
+    self._content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
     self._dir = directory
     self._filename = filename
     self._force_download = force_download
+    self.__file: BinaryIO | None = None
+    self.__size: int = 0
+    self.__parts: list[bytes | FileRegion] = []
+    self.__range: str | None = None
+    self.__if_range: str | None = None
+
+  def _negotiate_range(self: "File", range_header: str | None, if_range: str | None) -> None:
+    """Serve only the byte ranges asked by the client's `Range` / `If-Range` headers."""
+    self.__range = range_header
+    self.__if_range = if_range
 
   def __get_content_disposition(self) -> str:
      if self._content_type in self.__INLINE_TYPES and not self._force_download:
         return f"Content-Disposition: inline\r\n"
-     return f'Content-Disposition: attachment; filename="{self._filename}"\r\n\r\n'
+     return f'Content-Disposition: attachment; filename="{self._filename}"\r\n'
 
-  def _build(self: "File") -> bytes:
+  def __open(self: "File") -> os.stat_result:
     file_path = FileUtil.find(filename=self._filename, directory=self._dir)
-    if file_path is None:
-      raise FileNotFoundError
+    if file_path is None or not file_path.is_file():
+      raise NotFoundException("File")
+
+    try:
+      self.__file = open(file_path, "rb")
+    except OSError:
+      raise NotFoundException("File")
+    stat = os.fstat(self.__file.fileno())
+    self.__size = stat.st_size
+    return stat
+
+  def __parse_ranges(self: "File", range_header: str) -> list[tuple[int, int]] | None:
+    # None: header is invalid and must be ignored — []: nothing is satisfiable
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+      return None
+
+    ranges: list[tuple[int, int]] = []
+    for part in spec.split(","):
+      first, separator, last = part.strip().partition("-")
+      if not separator or not (first or last) or (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+      if not first:
+        suffix = int(last)
+        if suffix == 0:
+          continue
+        start, end = max(0, self.__size - suffix), self.__size - 1
+      else:
+        start = int(first)
+        end = int(last) if last else self.__size - 1
+        if last and end < start:
+          return None
+        end = min(end, self.__size - 1)
+
+      if start < self.__size:
+        ranges.append((start, end))
+
+    if len(ranges) > self.__MAX_RANGES:
+      return None
+
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+      if merged and start <= merged[-1][1] + 1:
+        merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+      else:
+        merged.append((start, end))
+    return merged
+
+  def __requested_ranges(self: "File", etag: str, last_modified: str) -> list[tuple[int, int]] | None:
+    if self.__range is None or self.status_code != HttpCode.OK:
+      return None
+    if self.__if_range is not None and self.__if_range.strip() not in (etag, last_modified):
+      return None
+    return self.__parse_ranges(range_header=self.__range)
+
+  def _build(self: "File") -> bytes:
+    # only the head is built here: the content goes out from the file
+    # descriptor in _body_stream() without being loaded into memory
+    stat = self.__open()
+    file = self.__file
+    etag = f'"{stat.st_mtime_ns:x}-{self.__size:x}"'
+    last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+    self.add_header("Accept-Ranges", "bytes")
+    self.add_header("ETag", etag)
+    self.add_header("Last-Modified", last_modified)
+
+    ranges = self.__requested_ranges(etag=etag, last_modified=last_modified)
+    content_type = self._content_type
+    content_length = self.__size
+    self.__parts = [FileRegion(file=file, offset=0, count=self.__size)] # type: ignore
+
+    if ranges is not None and not ranges:
+      self._set_status_code(http_code=HttpCode.RANGE_NOT_SATISFIABLE)
+      self.add_header("Content-Range", f"bytes */{self.__size}")
+      content_length = 0
+      self.__parts = []
+
+    elif ranges is not None and len(ranges) == 1:
+      start, end = ranges[0]
+      self._set_status_code(http_code=HttpCode.PARTIAL_CONTENT)
+      self.add_header("Content-Range", f"bytes {start}-{end}/{self.__size}")
+      content_length = end - start + 1
+      self.__parts = [FileRegion(file=file, offset=start, count=content_length)] # type: ignore
+
+    elif ranges is not None:
+      boundary = secrets.token_hex(16)
+      self._set_status_code(http_code=HttpCode.PARTIAL_CONTENT)
+      content_type = f"multipart/byteranges; boundary={boundary}"
+      self.__parts = []
+      for start, end in ranges:
+        self.__parts.append((
+          f"\r\n--{boundary}\r\n"
+          f"Content-Type: {self._content_type}\r\n"
+          f"Content-Range: bytes {start}-{end}/{self.__size}\r\n\r\n"
+        ).encode("utf-8"))
+        self.__parts.append(FileRegion(file=file, offset=start, count=end - start + 1)) # type: ignore
+      self.__parts.append(f"\r\n--{boundary}--\r\n".encode("utf-8"))
+      content_length = sum(len(p) if isinstance(p, bytes) else p.count for p in self.__parts)
+
+    return self._serialize(
+      fields=self._content_fields(content_type, content_length) + self.__get_content_disposition().encode("utf-8")
+    )
+
+  def _body_stream(self: "File") -> Iterator[bytes | FileRegion]:
+    file = self.__file
+    if file is None:
+      return iter(())
+    return _FileBody(parts=self.__parts, file=file)
+
+
+class _FileBody:
+  """
+  The parts of a `File` response, as the server sends them. The file is closed
+  once they are all out, or when the server closes the body early: unlike a
+  generator's `finally`, `close()` also works before the first part was taken.
+  """
+  __slots__ = ("__parts", "__file")
+
+  def __init__(self: "_FileBody", parts: list[bytes | FileRegion], file: BinaryIO) -> None:
+    self.__parts = iter(parts)
+    self.__file = file
 
-    file_bytes: bytes | None = FileUtil.read(path=file_path)
-    if file_bytes is None:
-      raise ValueError
+  def __iter__(self: "_FileBody") -> "_FileBody":
+    return self
 
-    response_message: str = self._status_line()
-    response_message += f"Content-Type: {self._content_type}\r\n"
-    response_message += f"Content-Length: {len(file_bytes)}\r\n"
-    response_message += self.__get_content_disposition()
-    encoded_message: bytes = response_message.encode(encoding="utf-8")
+  def __next__(self: "_FileBody") -> bytes | FileRegion:
+    part = next(self.__parts, None)
+    if part is None:
+      self.close()
+      raise StopIteration
+    return part
 
-    return encoded_message + file_bytes
+  def close(self: "_FileBody") -> None:
+    self.__file.close()
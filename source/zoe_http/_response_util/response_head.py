@@ -0,0 +1,31 @@
+import time
+from email.utils import formatdate
+
+from zoe_http.code import HttpCode
+
+class ResponseHead:
+    """
+    Pre-encoded pieces shared by every response head.
+    ---
+    Status lines are encoded once per `HttpCode` at import, and the `Date`
+    line is formatted at most once per second, whatever the request rate.
+    """
+    __STATUS_LINES: dict[HttpCode, bytes] = {
+        http_code: f"HTTP/1.1 {http_code.code} {http_code.message}\r\n".encode("latin-1")
+        for http_code in HttpCode
+    }
+    # (second, line): replaced as a whole, so threads never see a torn pair
+    __date: tuple[int, bytes] = (0, b"")
+
+    @staticmethod
+    def status_line(http_code: HttpCode) -> bytes:
+        return ResponseHead.__STATUS_LINES[http_code]
+
+    @staticmethod
+    def date_line() -> bytes:
+        now = int(time.time())
+        second, line = ResponseHead.__date
+        if second != now:
+            line = b"Date: " + formatdate(now, usegmt=True).encode("ascii") + b"\r\n"
+            ResponseHead.__date = (now, line)
+        return line
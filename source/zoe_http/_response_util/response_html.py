@@ -10,13 +10,6 @@ class Html(Response):
     self._body = html_content
     self._charset = charset
 
-  def _build(self: "Html") -> bytes:
-    response_message: str = self._status_line()
-    response_message += self._content_line(
-      content_type=f"{self._content_type}; charset={self._charset}",
-      body=self._body
-    )
-    response_message = self._apply_headers_to_response(response_str=response_message)
-    response_message += self._body
-
-    return response_message.encode(self._charset)
+  def _parts(self: "Html") -> tuple[bytes, bytes]:
+    body = self._body.encode(self._charset)
+    return self._content_fields(f"{self._content_type}; charset={self._charset}", len(body)), body
@@ -10,34 +10,18 @@ class Json(Response):
     super().__init__(http_code, headers)
     self._body = body
 
-  def _build(self) -> bytes:
-    response_message = self._status_line()
+  def _parts(self) -> tuple[bytes, bytes]:
+    if self._body is None:
+      return super()._parts()
 
-    body_data = None
-    if self._body is not None:
-      body_data = self.__serialize_to_json(self._body)
-      body_json_str = json.dumps(body_data)
+    body = json.dumps(self._body, default=self.__to_json).encode("utf-8")
+    return self._content_fields(self._content_type, len(body)), body
 
-      response_message += self._content_line(content_type=self._content_type,body=body_json_str)
-      response_message = self._apply_headers_to_response(response_str=response_message)
-
-      if body_data is not None:
-          response_message += body_json_str  # type: ignore
-
-    return response_message.encode("utf-8")
-
-  def __serialize_to_json(self, obj: Any) -> Any:
+  @staticmethod
+  def __to_json(obj: Any) -> Any:
+      # called by the encoder only for what JSON has no native form for
       if hasattr(obj, 'to_dict') and callable(obj.to_dict):
-          return self.__serialize_to_json(obj=obj.to_dict())
-      elif isinstance(obj, dict):
-          return {k: self.__serialize_to_json(v) for k, v in obj.items()}
-      elif isinstance(obj, list):
-          return [self.__serialize_to_json(i) for i in obj]
+          return obj.to_dict()
       elif hasattr(obj, '__dict__') and not isinstance(obj, type):
-          return self.__serialize_to_json(vars(obj))
-      elif isinstance(obj, (str, int, float, bool)) or obj is None:
-          return obj
-      else:
-          return str(obj)
-
-
+          return vars(obj)
+      return str(obj)
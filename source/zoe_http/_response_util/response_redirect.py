@@ -8,11 +8,5 @@ class Redirect(Response):
     super().__init__(http_code=http_code, headers=headers)
     self._redirect_to = redirect_to
 
-  def _build(self) -> bytes:
-    response_message = self._status_line()
-    response_message += f"Location: {self._redirect_to}\r\n"
-    response_message += "Content-Length: 0\r\n"
-    response_message = self._apply_headers_to_response(response_message)
-    response_message += "\r\n"
-
-    return response_message.encode("utf-8")
+  def _parts(self) -> tuple[bytes, bytes]:
+    return f"Location: {self._redirect_to}\r\nContent-Length: 0\r\n".encode("utf-8"), b""
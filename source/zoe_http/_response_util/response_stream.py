@@ -0,0 +1,50 @@
+from zoe_http.response import Response
+from zoe_http.code import HttpCode
+
+from typing import Any, Iterable, Iterator
+
+class Stream(Response):
+  __LAST_CHUNK = b"0\r\n\r\n"
+
+  def __init__(
+          self: "Stream",
+          http_code: HttpCode,
+          body: Iterable[bytes | str],
+          content_type: str = "application/octet-stream",
+          content_length: int | None = None,
+          charset: str = "utf-8",
+          headers: dict[str, Any] | None = None
+    ) -> None:
+    super().__init__(http_code=http_code, headers=headers)
+    self._body = body
+    self._content_type = content_type
+    self._content_length = content_length
+    self._charset = charset
+    self._chunked = content_length is None
+
+  def _close_delimited(self: "Stream") -> None:
+    # HTTP/1.0 clients do not understand chunked framing: the end of the
+    # body is signalled by closing the connection instead
+    self._chunked = False
+
+  def _build(self: "Stream") -> bytes:
+    if self._content_length is not None:
+      return self._serialize(fields=self._content_fields(self._content_type, self._content_length))
+    fields = f"Content-Type: {self._content_type}\r\n".encode("utf-8")
+    if self._chunked:
+      fields += b"Transfer-Encoding: chunked\r\n"
+    return self._serialize(fields=fields)
+
+  def _body_stream(self: "Stream") -> Iterator[bytes]:
+    for piece in self._body:
+      if isinstance(piece, str):
+        piece = piece.encode(self._charset)
+      if not piece:
+        continue
+      if self._chunked:
+        yield b"".join((b"%X\r\n" % len(piece), piece, b"\r\n"))
+      else:
+        yield piece
+
+    if self._chunked:
+      yield self.__LAST_CHUNK
@@ -10,15 +10,6 @@ class PlainText(Response):
     self._body = text
     self._charset = charset
 
-  def _build(self: "PlainText") -> bytes:
-    response_message: str = ""
-    response_message = self._status_line()
-
-    response_message += self._content_line(content_type=self._content_type,body=self._body)
-    response_message = self._apply_headers_to_response(response_str=response_message)
-    try:
-      response_message += str(self._body)
-    except Exception as exc:
-      raise exc
-
-    return response_message.encode(encoding=self._charset)
+  def _parts(self: "PlainText") -> tuple[bytes, bytes]:
+    body = str(self._body).encode(self._charset)
+    return self._content_fields(self._content_type, len(body)), body
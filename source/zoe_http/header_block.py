@@ -0,0 +1,44 @@
+class HeaderBlock:
+    """
+    An immutable set of response headers, encoded once.
+    ---
+    Build it when the middleware is created and attach it to each response
+    with `Response.add_header_block()`: the block is kept by reference and its
+    bytes are spliced into the head as they are, instead of adding the headers
+    one by one on every request.
+
+    Headers of a block take precedence over the same names set with
+    `add_header()`. Blocks attached to one response should not overlap.
+
+    ---
+
+    *Example:*
+    ```python
+    class NoStore:
+        __HEADERS = HeaderBlock({"Cache-Control": "no-store", "Pragma": "no-cache"})
+
+        def process(self, request, next):
+            return next(request).add_header_block(self.__HEADERS)
+    ```
+    """
+    __slots__ = ("__names", "__encoded")
+
+    def __init__(self: "HeaderBlock", headers: dict[str, str]) -> None:
+        for name, value in headers.items():
+            if any(c in f"{name}{value}" for c in "\r\n") or not name or ":" in name:
+                raise ValueError(f"Invalid header: {name!r}.")
+        self.__names = frozenset(name.lower() for name in headers)
+        self.__encoded = "".join(f"{name}: {value}\r\n" for name, value in headers.items()).encode("utf-8")
+
+    @property
+    def names(self: "HeaderBlock") -> frozenset[str]:
+        """Lower-cased names of the headers in the block."""
+        return self.__names
+
+    @property
+    def encoded(self: "HeaderBlock") -> bytes:
+        """The `Name: value\\r\\n` lines of the block."""
+        return self.__encoded
+
+    def __repr__(self: "HeaderBlock") -> str:
+        return f"HeaderBlock({sorted(self.__names)})"
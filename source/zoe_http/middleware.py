@@ -5,6 +5,21 @@ from zoe_http.response import Response
 
 @runtime_checkable
 class Middleware(Protocol):
+    """
+    A middleware wraps request handling: `process()` receives the request and the
+    `next` callable of the chain.
+    ---
+    A middleware may also define `process_headers(request) -> Response | None`.
+    It runs once per request, as soon as the request line and headers have
+    arrived and *before* the body is read (`request.body` is not available yet).
+    Returning a `Response` rejects the request right away — the body is never
+    read and, for `Expect: 100-continue` clients, never sent. Returning `None`
+    lets the request through.
+
+    The server runs that phase only when the body is still on its way, so a
+    check made there must also be made in `process()`, which can skip it when
+    `request.headers_checked` is set. A rejection from the header phase still
+    goes through the `process()` of the middlewares registered before.
+    """
     def process(self, request: Request, next: Callable[[Request], Response]) -> Response:
         raise NotImplementedError("Middleware protocol must implement process() function")
-
@@ -15,5 +15,12 @@ class ThreadSafeMiddleware(Middleware):
     with self.__lock:
       return self.process_locked(request, next)
 
+  def process_headers(self: "ThreadSafeMiddleware", request: Request) -> Response | None:
+    with self.__lock:
+      return self.process_headers_locked(request)
+
   def process_locked(self, request: Request, next: Callable) -> Response:
       ...
+
+  def process_headers_locked(self, request: Request) -> Response | None:
+      return None
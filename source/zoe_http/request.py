@@ -1,5 +1,4 @@
-from typing import Any
-from urllib.parse import unquote
+from typing import Any, Iterator
 import json
 
 from zoe_http.method import HttpMethod
@@ -7,37 +6,114 @@ from zoe_http._request_util.query_params import QueryParams
 from zoe_http._request_util.path_params import PathParams
 from zoe_http._request_util.form_params import FormParams
 from zoe_http._request_util.request_auth import Auth
+from zoe_http._request_util.request_headers import Headers
+from zoe_http._request_util.request_body import RequestBody
+from zoe_http._request_util.form_parser import MultipartParser, UrlencodedParser
+from zoe_http._request_util.request_parser import RequestParser, RequestHead
 from zoe_exceptions.http_exceptions.exc_malformed_request import MalformedRequestException
 
+_UNPARSED: Any = object()
+
 class Request:
-    def __init__(self: "Request", raw_data: str, client_ip: str) -> None:
-        self.__fields: dict[Any, Any] = {}
+    """
+    An HTTP request as seen by middlewares and handlers.
+    ---
+    Only the request line is decoded up front. Headers, query parameters, the
+    JSON body and the `Auth` helper are parsed the first time they are read, so
+    an endpoint pays only for what it uses. The body itself is kept as the bytes
+    received: `raw_body` exposes them as is, `text()` and `body` (JSON) decode
+    them on demand. Large uploads are not read before the handler runs:
+    `stream()` hands them over piece by piece, straight from the connection.
+    Form bodies are parsed into `form_params` as they stream in.
+    """
+    __slots__ = (
+        "__head", "__raw_body", "__client_ip", "__method", "__route", "__query_string",
+        "__content_length", "__headers", "__query_params", "__path_params",
+        "__form_params", "__body", "__auth", "__headers_checked"
+    )
+
+    __MULTIPART = "multipart/form-data"
+    __URLENCODED = "application/x-www-form-urlencoded"
+
+    def __init__(self: "Request", raw_data: str | bytes, client_ip: str) -> None:
+        raw: bytes = raw_data.encode("utf-8") if isinstance(raw_data, str) else raw_data
+        parser = RequestParser(max_head_size=len(raw))
+        parser.feed(raw)
+
+        head: RequestHead | None = parser.parse_head()
+        if head is None:
+            raise MalformedRequestException("request head is incomplete.")
+
+        self.__setup(head=head, body=parser.take(parser.buffered), client_ip=client_ip)
+
+    @classmethod
+    def from_head(cls, head: RequestHead, body: bytes | bytearray | RequestBody, client_ip: str) -> "Request":
+        request = cls.__new__(cls)
+        request.__setup(head=head, body=body, client_ip=client_ip)
+        return request
+
+    def __setup(self: "Request", head: RequestHead, body: bytes | bytearray | RequestBody, client_ip: str) -> None:
+        if not head.method or not head.target or not head.http_version:
+            raise MalformedRequestException("invalid request line format.")
+
+        self.__head = head
+        self.__raw_body = body
         self.__client_ip = client_ip
-        self.__raw_data = raw_data
-
-        self.__method: HttpMethod
-        self.__route: str
-        self.__http_version: str
-        self.__body: dict | Any
-
-        self.__content_type: str
-        self.__content_length: int
-        self.__host: str
-        self.__headers: dict[str, str] 
-        self.__accept: str
-        self.__connection: str
-
-        self.__form_params = FormParams()
-        self.__query_params = QueryParams()
-        self.__path_params = PathParams()
+        self.__method: HttpMethod = HttpMethod.str_to_method(method_str=head.method)
 
-        self.__parse()
-        self.__auth: Auth = Auth(authorization_header=self.headers.get("Authorization", None))
+        route, _, self.__query_string = head.target.partition("?")
+        if len(route) > 1 and route.endswith("/"):
+            route = route[:-1]
+        self.__route: str = route
+
+        # a declared Content-Length was validated by the parser; chunked bodies have none
+        self.__content_length: int = head.content_length or (0 if isinstance(body, RequestBody) else len(body))
+
+        self.__headers: Headers | None = None
+        self.__query_params: QueryParams | None = None
+        self.__path_params = PathParams()
+        self.__form_params: FormParams | None = None
+        self.__body: dict | Any = _UNPARSED
+        self.__auth: Auth | None = None
+        self.__headers_checked: bool = False
 
     @property
     def body(self: "Request") -> dict | Any:
+        if self.__body is _UNPARSED:
+            # form bodies are read through `form_params`, not as JSON
+            if self.__media_type() in (self.__MULTIPART, self.__URLENCODED):
+                self.__body = None
+            else:
+                self.__body = self.__parse_body(body_raw_part=self.__buffered_body())
         return self.__body
 
+    @property
+    def raw_body(self: "Request") -> memoryview:
+        """
+        The body exactly as received (read-only, no copy). Use `bytes(request.raw_body)`
+        for a copy. A streamed body is read whole first, spooled to a temporary
+        file past the server's `spool_threshold`.
+        """
+        return memoryview(self.__buffered_body()).toreadonly()
+
+    def stream(self: "Request") -> Iterator[bytes]:
+        """
+        Yields the body in pieces as they arrive, without keeping them. A body can
+        be streamed once, before the handler returns: whatever is left unread
+        then is discarded.
+        """
+        if isinstance(self.__raw_body, RequestBody):
+            return self.__raw_body.stream()
+        return iter((bytes(self.__raw_body),) if self.__raw_body else ())
+
+    def text(self: "Request", encoding: str | None = None) -> str:
+        """Decodes the body with `encoding`, else the `charset` of `Content-Type`, else UTF-8."""
+        charset = encoding or self.__charset() or "utf-8"
+        try:
+            return str(self.__buffered_body(), charset)
+        except (UnicodeDecodeError, LookupError):
+            raise MalformedRequestException(f"body is not valid '{charset}' text.")
+
     @property
     def method(self: "Request") -> HttpMethod:
         return self.__method
@@ -47,24 +123,29 @@ class Request:
         return self.__route
 
     @property
-    def headers(self: "Request") -> dict[str, Any]:
+    def headers(self: "Request") -> Headers:
+        if self.__headers is None:
+            self.__headers = Headers(raw=self.__head.headers)
         return self.__headers
-    
+
     @property
     def content_type(self: "Request") -> str:
-        return self.__content_type
-    
+        return self.headers.get("Content-Type", "")
+
     @property
     def content_length(self: "Request") -> int:
+        # a streamed chunked body has no declared size: report what was read so far
+        if not self.__content_length and isinstance(self.__raw_body, RequestBody):
+            return self.__raw_body.size
         return self.__content_length
 
     @property
     def host(self: "Request") -> str:
-        return self.__host
+        return self.headers.get("Host", "")
 
     @property
     def http_version(self: "Request") -> str:
-        return self.__http_version
+        return self.__head.http_version
 
     @property
     def client_ip(self: "Request") -> str:
@@ -73,86 +154,88 @@ class Request:
     @property
     def path_params(self: "Request") -> PathParams:
         return self.__path_params
-    
+
     @property
     def query_params(self: "Request") -> QueryParams:
+        if self.__query_params is None:
+            self.__query_params = QueryParams.parse(query_string=self.__query_string)
         return self.__query_params
-    
+
     @property
     def form_params(self: "Request") -> FormParams:
+        """Fields of a `multipart/form-data` or `application/x-www-form-urlencoded` body."""
+        if self.__form_params is None:
+            self.__form_params = self.__parse_form()
         return self.__form_params
 
     @property
     def auth(self: "Request") -> Auth:
+        if self.__auth is None:
+            self.__auth = Auth(authorization_header=self.__head.header("Authorization"))
         return self.__auth
 
+    @property
+    def headers_checked(self: "Request") -> bool:
+        """
+        Whether the server already ran the `process_headers` hooks on this request
+        and all of them let it through. Checks a middleware makes in both
+        `process_headers` and `process` can then be skipped in `process`.
+        """
+        return self.__headers_checked
+
+    def _mark_headers_checked(self: "Request") -> None:
+        self.__headers_checked = True
+
     def set_path_params(self: "Request", params: dict) -> None:
         for k, v in params.items():
             self.__path_params[k] = v
 
-    def __parse_query_params(self: "Request", query_string: str) -> None:
-        for param in query_string.split("&"):
-            if "=" in param:
-                key, value = param.split("=", 1)
-                self.__query_params[key] = unquote(value)
-
-    def __parse_request_line(self, request_raw_part: str) -> "Request":
-        (method, full_path, http_version) = request_raw_part.split(" ")
-        
-        if not method or not full_path or not http_version:
-            raise MalformedRequestException("invalid request line format.")
-
-        full_path_normalized: str = full_path
-        if len(full_path) > 1 and full_path.endswith("/"):
-            full_path_normalized = full_path[:-1]
-
-        if "?" in full_path_normalized:
-            self.__route, query_string = full_path.split("?", 1)
-            self.__parse_query_params(query_string)
+    def __buffered_body(self: "Request") -> bytes | bytearray | memoryview:
+        if isinstance(self.__raw_body, RequestBody):
+            return self.__raw_body.read()
+        return self.__raw_body
+
+    def __media_type(self: "Request") -> str:
+        return self.content_type.partition(";")[0].strip().lower()
+
+    def __content_type_param(self: "Request", key: str) -> str | None:
+        for parameter in self.content_type.split(";")[1:]:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == key:
+                return value.strip().strip('"')
+        return None
+
+    def __charset(self: "Request") -> str | None:
+        return self.__content_type_param(key="charset")
+
+    def __parse_form(self: "Request") -> FormParams:
+        media_type = self.__media_type()
+        parser: MultipartParser | UrlencodedParser
+        if media_type == self.__MULTIPART:
+            parser = MultipartParser(boundary=self.__content_type_param(key="boundary") or "")
+        elif media_type == self.__URLENCODED:
+            parser = UrlencodedParser(charset=self.__charset() or "utf-8")
         else:
-            self.__route = full_path_normalized
-        
-        self.__method = HttpMethod.str_to_method(method_str=method)
-        self.__http_version = http_version
-        return self
-
-    def __parse_headers(self, header_raw_part: list[str]) -> "Request":
-        self.__headers = {}
-        for header in header_raw_part:
-            key, _, value = header.partition(": ")
-            match key:
-                case "Content-Length":
-                    try:
-                        self.__content_length = int(value)
-                    except ValueError:
-                        raise MalformedRequestException(f"Content-Length '{value}' is not a valid integer.")
-                case "Host":
-                    self.__host = value
-                case "Content-Type":
-                    self.__content_type = value
-                case "Accept":
-                    self.__accept = value
-                case "Connection":
-                    self.__connection = value
-                case _:
-                    self.__headers[key] = value
-        return self
-        
-    def __parse_body(self, body_raw_part: str) -> "Request":
+            return FormParams()
+
+        try:
+            for piece in self.stream():
+                parser.feed(piece)
+            return parser.close()
+        except BaseException:
+            # also a body that could not be read to its end: uploads already spooled are released
+            parser.discard()
+            raise
+
+    @staticmethod
+    def __parse_body(body_raw_part: bytes | bytearray | memoryview) -> dict | Any:
+        if isinstance(body_raw_part, memoryview):
+            body_raw_part = body_raw_part.tobytes()
         if not body_raw_part.strip():
-            self.__body = None
-            return self
+            return None
         try:
-            self.__body = json.loads(body_raw_part)
+            return json.loads(body_raw_part)
         except json.JSONDecodeError as exc:
             raise MalformedRequestException(f"body is not valid JSON — {exc.msg} at line {exc.lineno}, col {exc.colno}.")
-        return self
-
-    def __parse(self: "Request") -> None:
-        splitted_data: list[str] = self.__raw_data.split("\r\n")
-        empty_line_index:int = splitted_data.index("")
-        body_raw:str = "\r\n".join(splitted_data[empty_line_index + 1:]) 
-
-        self.__parse_request_line(request_raw_part=splitted_data[0])\
-        .__parse_headers(header_raw_part=splitted_data[1:empty_line_index])\
-        .__parse_body(body_raw_part=body_raw)
\ No newline at end of file
+        except UnicodeDecodeError:
+            raise MalformedRequestException("body is not valid UTF-8 encoded JSON.")
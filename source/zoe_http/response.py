@@ -1,45 +1,109 @@
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from zoe_http.code import HttpCode
-from datetime import datetime, timezone
+from zoe_http._file_util import FileRegion
+from zoe_http.header_block import HeaderBlock
+from zoe_http._response_util.response_head import ResponseHead
 
 class Response:
+    __POWERED_BY = b"X-Powered-By: Zoe\r\n"
+
     def __init__(self, http_code: HttpCode, headers: dict[str,Any ] | None = None) -> None:
-        self.__http_version: str = "HTTP/1.1"
         self.__status_code = http_code
-        self.__headers: dict[str, str] = {
-          "Date": datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT"),
-          "X-Powered-By": "Zoe",
-          **(dict(headers) if headers else {})
-        }
+        # `Date` and `X-Powered-By` are added when the head is serialized, unless set here
+        self.__headers: dict[str, str] = dict(headers) if headers else {}
+        self.__blocks: tuple[HeaderBlock, ...] = ()
 
     @property
     def status_code(self) -> HttpCode:
         return self.__status_code
 
+    def _set_status_code(self, http_code: HttpCode) -> None:
+        self.__status_code = http_code
+
     def add_header(self, key: str, value: str) -> "Response":
         self.__headers[key] = value
         return self
 
+    def add_header_block(self, block: HeaderBlock) -> "Response":
+        """Attaches a pre-encoded `HeaderBlock`, kept by reference until the head is serialized."""
+        self.__blocks += (block,)
+        return self
+
     def _build(self) -> bytes:
-        response_message = self._status_line()
-        response_message = self._apply_headers_to_response(response_str=response_message)
-        return response_message.encode("utf-8")
+        fields, body = self._parts()
+        return self._serialize(fields=fields, body=body)
+
+    def _parts(self) -> tuple[bytes, bytes]:
+        """Content fields and encoded body of a response built in memory."""
+        # no body: framed explicitly so that keep-alive clients do not wait for one
+        if self.__status_code in (HttpCode.NO_CONTENT, HttpCode.NOT_MODIFIED):
+            return b"", b""
+        return b"Content-Length: 0\r\n", b""
 
-    def _status_line(self) -> str:
-        return f"{self.__http_version} {self.__status_code.code} {self.__status_code.message}" + "\r\n"
+    def _freeze(self) -> "Canned": # type: ignore
+        """
+        Serializes the response once, for one that is sent over and over: only
+        its status line, `Date` and the headers added afterwards are written per
+        send, by the copies `_copy()` makes of the returned `Canned`.
+        """
+        from zoe_http._response_util.response_canned import Canned
+        if self._body_stream() is not None:
+            raise TypeError(f"'{type(self).__name__}' responses are streamed and cannot be pre-serialized.")
+        fields, body = self._parts()
+        return Canned(
+          http_code=self.__status_code,
+          fields=b"".join((
+            b"" if "X-Powered-By" in self.__headers else self.__POWERED_BY,
+            fields,
+            self._header_lines()
+          )),
+          body=body,
+          dated="Date" not in self.__headers
+        )
 
-    def _content_line(self, content_type: str, body: str) -> str:
-        encoded = body.encode("utf-8")
-        content_line: str = ""
-        content_line += f"Content-Type: {content_type}\r\n"
-        content_line += f"Content-Length: {len(encoded)}\r\n"
-        return content_line
+    def _body_stream(self) -> Iterator[bytes | FileRegion] | None:
+        """Body pieces sent after `_build()`, for responses that are not built in memory at once."""
+        return None
 
-    def _apply_headers_to_response(self, response_str: str) -> str:
-        for header_name, header_value in self.__headers.items():
-          response_str += f"{header_name}: {header_value}\r\n"
-        return response_str + "\r\n"
+    def _serialize(self, fields: bytes = b"", body: bytes = b"") -> bytes:
+        """
+        Assembles the message in a single join: the cached status and `Date`
+        lines, `fields` (pre-encoded `Name: value\\r\\n` lines), the headers, the
+        attached header blocks as they are, and `body`, which must already be
+        encoded.
+        """
+        return b"".join((
+          ResponseHead.status_line(self.__status_code),
+          b"" if "Date" in self.__headers else ResponseHead.date_line(),
+          b"" if "X-Powered-By" in self.__headers else self.__POWERED_BY,
+          fields,
+          self._header_lines(),
+          b"\r\n",
+          body
+        ))
+
+    def _header_names(self) -> set[str]:
+        """Lower-cased names of the headers set with `add_header()` or attached in blocks."""
+        names = {name.lower() for name in self.__headers}
+        for block in self.__blocks:
+            names |= block.names
+        return names
+
+    def _header_lines(self) -> bytes:
+        """The headers set with `add_header()`, then the attached header blocks."""
+        blocks = self.__blocks
+        if not blocks:
+            return "".join(f"{name}: {value}\r\n" for name, value in self.__headers.items()).encode("utf-8")
+        headers = "".join(
+          f"{name}: {value}\r\n" for name, value in self.__headers.items()
+          if not any(name.lower() in block.names for block in blocks)
+        )
+        return b"".join((headers.encode("utf-8"), *(block.encoded for block in blocks)))
+
+    @staticmethod
+    def _content_fields(content_type: str, content_length: int) -> bytes:
+        return b"Content-Type: %s\r\nContent-Length: %d\r\n" % (content_type.encode("utf-8"), content_length)
 
     @classmethod
     def json(cls,
@@ -89,3 +153,15 @@ class Response:
             ) -> "File": # type: ignore
       from zoe_http._response_util.response_file import File
       return File(filename=filename, directory=directory, force_download=force_download, headers=headers, http_code=http_code)
+
+    @classmethod
+    def stream(cls,
+               body: Iterable[bytes | str],
+               content_type: str = "application/octet-stream",
+               http_code: HttpCode = HttpCode.OK,
+               content_length: int | None = None,
+               charset: str = "utf-8",
+               headers: dict[str, Any] | None = None
+              ) -> "Stream": # type: ignore
+        from zoe_http._response_util.response_stream import Stream
+        return Stream(http_code=http_code, body=body, content_type=content_type, content_length=content_length, charset=charset, headers=headers)
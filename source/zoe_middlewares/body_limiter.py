@@ -14,7 +14,8 @@ class BodyLimiter:
         Protects the server against payload flooding and resource exhaustion attacks,
         where malicious clients send oversized request bodies to consume memory and CPU.
         If the request body exceeds the limit, the server responds with
-        `413 Payload Too Large` before the handler is ever called.
+        `413 Payload Too Large` before the handler is ever called. A declared
+        `Content-Length` over the limit is rejected before the body is read.
 
         ---
 
@@ -40,11 +41,22 @@ class BodyLimiter:
         ```
         """
         self.__max_size: Bytes = max_size
+        self.__rejection = ZoeHttpException(
+            message=f"Payload too large. Maximum allowed size is {max_size.value} bytes",
+            status_code=HttpCode.PAYLOAD_TOO_LARGE
+        ).to_response()._freeze()
+
+    def process_headers(self: "BodyLimiter", request: Request) -> Response | None:
+        # a declared Content-Length is checked before any of the body is read
+        if request.content_length > self.__max_size.value:
+            return self.__too_large()
+        return None
 
     def process(self: "BodyLimiter", request: Request, next: Callable) -> Response:
+        # requests the header phase did not see, and bodies whose size was not declared
         if request.content_length > self.__max_size.value:
-            return ZoeHttpException(
-                message=f"Payload too large. Maximum allowed size is {self.__max_size.value} bytes",
-                status_code=HttpCode.PAYLOAD_TOO_LARGE
-            ).to_response()
+            return self.__too_large()
         return next(request)
+
+    def __too_large(self: "BodyLimiter") -> Response:
+        return self.__rejection._copy()
@@ -3,6 +3,7 @@ from zoe_http.request import Request
 from zoe_http.response import Response
 from zoe_http.code import HttpCode
 from zoe_http.method import HttpMethod
+from zoe_http.header_block import HeaderBlock
 from typing import Callable
 
 class CORS:
@@ -52,29 +53,50 @@ class CORS:
             "Authorization", "Content-Type", "Accept", "Origin", "X-Requested-With"
         ]
 
-    def __create_response_with_allow_headers(self, origin: str) -> Response:
+        # everything but an origin echoed under "*" is known now: encode it once
         allow_prefix: str = "Access-Control-Allow"
-        response: Response =  Response(
-            http_code=HttpCode.OK,
-            headers={
-                f"{allow_prefix}-Origin": origin or "*",
-                f"{allow_prefix}-Methods": ", ".join([m.value for m in self.__allowed_methods]),
-                f"{allow_prefix}-Headers": ", ".join(self.__allowed_headers),
-                f"{allow_prefix}-Max-Age": "86400"
-            }
-        )
-        return response
+        self.__preflight_headers = HeaderBlock({
+            f"{allow_prefix}-Methods": ", ".join([m.value for m in self.__allowed_methods]),
+            f"{allow_prefix}-Headers": ", ".join(self.__allowed_headers),
+            f"{allow_prefix}-Max-Age": "86400"
+        })
+        self.__origin_headers: dict[str, HeaderBlock] = {
+            origin: HeaderBlock({f"{allow_prefix}-Origin": origin})
+            for origin in self.__allowed_origins if origin != "*"
+        }
+        self.__origin_headers[""] = HeaderBlock({f"{allow_prefix}-Origin": "*"})
 
-    def process(self, request: Request, next: Callable) -> Response:
+    def __allow_origin(self, response: Response, origin: str) -> Response:
+        headers = self.__origin_headers.get(origin)
+        if headers is None:
+            return response.add_header(key="Access-Control-Allow-Origin", value=origin)
+        return response.add_header_block(headers)
+
+    def __create_response_with_allow_headers(self, origin: str) -> Response:
+        response: Response = Response(http_code=HttpCode.OK).add_header_block(self.__preflight_headers)
+        return self.__allow_origin(response=response, origin=origin)
+
+    def __is_allowed(self, origin: str) -> bool:
+        return "*" in self.__allowed_origins or origin in self.__allowed_origins
+
+    def process_headers(self, request: Request) -> Response | None:
+        # preflights are answered in the header phase, ahead of guards registered after CORS
+        if request.method != HttpMethod.OPTIONS:
+            return None
         origin: str = request.headers.get("Origin", "")
-        who_is_allowed: str = "*" in self.__allowed_origins or origin in self.__allowed_origins # type: ignore
+        if self.__is_allowed(origin=origin):
+            return self.__create_response_with_allow_headers(origin=origin)
+        return Response(http_code=HttpCode.OK)
 
-        if request.method == HttpMethod.OPTIONS:
-            if who_is_allowed:
-                return self.__create_response_with_allow_headers(origin=origin)
-            return Response(http_code=HttpCode.OK)
+    def process(self, request: Request, next: Callable) -> Response:
+        preflight = self.process_headers(request)
+        if preflight is not None:
+            return preflight
+
+        origin: str = request.headers.get("Origin", "")
+        who_is_allowed: bool = self.__is_allowed(origin=origin)
 
         response = next(request)
         if who_is_allowed:
-            response.add_header(key="Access-Control-Allow-Origin", value=origin or "*")
+            response = self.__allow_origin(response=response, origin=origin)
         return response
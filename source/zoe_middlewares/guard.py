@@ -15,7 +15,8 @@ class Guard:
         ---
         Intercepts every request and delegates validation to a `GuardStrategy`.
         If the strategy returns `False`, the request is blocked and a
-        `401 Unauthorized` response is returned before the handler is called.
+        `401 Unauthorized` response is returned before the handler is called —
+        and before the request body is even read.
 
         Best practice is to attach `Guard` to a specific `Router` so only
         those routes are protected — but it can also be attached globally
@@ -51,12 +52,20 @@ class Guard:
         ```
         """
         self.__strategy: GuardStrategy = strategy
-        self.__message = unauthorized_message
+        self.__unauthorized = ZoeHttpException(
+            message=unauthorized_message,
+            status_code=HttpCode.UNAUTHORIZED
+        ).to_response()._freeze()
 
-    def process(self: "Guard", request: Request, next: Callable) -> Response:
+    def process_headers(self: "Guard", request: Request) -> Response | None:
+      # credentials travel in headers: unauthorized uploads are refused before their body is read
       if not self.__strategy.guard(request):
-            return ZoeHttpException(
-                message=self.__message,
-                status_code=HttpCode.UNAUTHORIZED
-            ).to_response()
+            return self.__unauthorized._copy()
+      return None
+
+    def process(self: "Guard", request: Request, next: Callable) -> Response:
+      if not request.headers_checked:
+            rejection = self.process_headers(request)
+            if rejection is not None:
+                  return rejection
       return next(request)
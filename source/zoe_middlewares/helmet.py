@@ -1,5 +1,6 @@
 from zoe_http.response import Response
 from zoe_http.request import Request
+from zoe_http.header_block import HeaderBlock
 from typing import Callable
 from enum import Enum
 
@@ -38,22 +39,21 @@ class Helmet:
     self.permissions_policy = permissions_policy
     self.cross_origin_embedder_policy = cross_origin_embedder_policy
     self.__hsts = hsts
+    self.__headers = self.__build_headers()
 
-  def __insert_headers(self: "Helmet", response: Response) -> Response:
-    for header_name, header_value in self.__DEFAULT_HEADERS.items():
-      if header_name == "Strict-Transport-Security" and not self.__hsts:
-        continue
-      response.add_header(header_name, header_value)
+  def __build_headers(self: "Helmet") -> HeaderBlock:
+    headers = dict(self.__DEFAULT_HEADERS)
+    if not self.__hsts:
+      del headers["Strict-Transport-Security"]
 
     if self.permissions_policy:
-      value = ", ".join([p.value for p in self.permissions_policy])
-      response.add_header("Permissions-Policy", value)
+      headers["Permissions-Policy"] = ", ".join([p.value for p in self.permissions_policy])
 
     if self.cross_origin_embedder_policy:
-      response.add_header("Cross-Origin-Embedder-Policy", self.cross_origin_embedder_policy.value)
+      headers["Cross-Origin-Embedder-Policy"] = self.cross_origin_embedder_policy.value
 
-    return response
+    return HeaderBlock(headers)
 
   def process(self: "Helmet", request: Request, next: Callable) -> Response:
     response = next(request)
-    return self.__insert_headers(response=response)
+    return response.add_header_block(self.__headers)
@@ -7,12 +7,15 @@ from typing import Callable, Any
 from datetime import datetime
 
 class Limiter(ThreadSafeMiddleware):
+    __TOO_MANY_REQUESTS = Response(http_code=HttpCode.TOO_MANY_REQUESTS)._freeze()
+
     def __init__(self, max_requests: int = 100, window_seconds: int = 60) -> None:
         """
         Rate limiting middleware based on client IP address.
         ---
         Tracks how many requests each client makes within a time window.
-        If the limit is exceeded, the server responds with `429 Too Many Requests`.
+        If the limit is exceeded, the server responds with `429 Too Many Requests`
+        as soon as the request headers arrive, without reading the body.
         Recommended for all production environments to prevent brute force attacks.
 
         ---
@@ -41,7 +44,7 @@ class Limiter(ThreadSafeMiddleware):
     def __client_exists(self: "Limiter", ip: str) -> bool:
         return self.__clients.__contains__(ip)
 
-    def process_locked(self: "Limiter", request: Request, next: Callable) -> Response:
+    def process_headers_locked(self: "Limiter", request: Request) -> Response | None:
         client: LimiterClient
         req_ip: str = request.client_ip
 
@@ -59,6 +62,15 @@ class Limiter(ThreadSafeMiddleware):
         client.increment()
 
         if client.request_count > self.__max_requests:
-            return Response(http_code=HttpCode.TOO_MANY_REQUESTS)
+            return self.__TOO_MANY_REQUESTS._copy()
+
+        return None
 
+    def process(self: "Limiter", request: Request, next: Callable) -> Response:
+        # a request the header phase already counted is not counted twice; the
+        # lock is only held while counting, not while the request runs
+        if not request.headers_checked:
+            rejection = self.process_headers(request)
+            if rejection is not None:
+                return rejection
         return next(request)
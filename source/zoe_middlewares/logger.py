@@ -3,6 +3,7 @@ from zoe_http.request import Request
 from zoe_http.response import Response
 from zoe_http.code import HttpCode
 from zoe_http.bytes import Bytes
+from zoe_exceptions.http_exceptions.exc_malformed_request import MalformedRequestException
 
 from typing import Callable
 from datetime import datetime
@@ -140,7 +141,9 @@ class Logger:
         print(f"{prefix}{ts}  {method}  {route}  {status}  {duration}")
 
         if self.__verbose:
-            if request.body:
+            if request.content_length and not self.__is_json(request):
+                print(f"  {_Color.GREY}body:    [{request.content_type or 'binary'} — {request.content_length} bytes]{_Color.RESET}")
+            elif request.body:
                 if request.content_length:
                     if request.content_length > self.__big_payload_threshold.value:
                         if self.__big_payload_warn:
@@ -154,3 +157,12 @@ class Logger:
             print(f"  {_Color.GREY}headers: {dict(request.headers)}{_Color.RESET}")
 
         return response
+
+    @staticmethod
+    def __is_json(request: Request) -> bool:
+        # binary uploads are summarized: decoding them here would turn the response into a 400
+        try:
+            request.body
+            return True
+        except MalformedRequestException:
+            return False
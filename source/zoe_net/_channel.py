@@ -0,0 +1,84 @@
+import socket
+import time
+from collections import deque
+from typing import Iterator
+
+from zoe_net.connection import Connection
+from zoe_http._file_util import FileRegion
+from zoe_http._request_util.request_parser import RequestParser, RequestHead
+
+class _Channel:
+    """
+    State of one client connection in `Server`.
+    ---
+    A channel is owned either by the reactor (while it waits for a request or for
+    the client to read its response) or by exactly one worker thread (while a
+    request is processed), never by both, so it needs no locking.
+    """
+
+    def __init__(self: "_Channel", conn: Connection, max_head_size: int) -> None:
+        self.socket: socket.socket = conn.socket_connection
+        address = conn.socket_address
+        # Unix domain socket peers have no IP address
+        self.client_ip: str = address[0] if isinstance(address, tuple) else ""
+        self.parser = RequestParser(max_head_size=max_head_size)
+        self.outbox: deque[bytes | memoryview | FileRegion] = deque()
+        self.body_stream: Iterator[bytes | FileRegion] | None = None
+        self.keep_alive = True
+        self.served = 0
+        self.events = 0
+        self.last_active = time.monotonic()
+        self.enqueued_at: float | None = None
+        # the head whose header phase already ran, and whether unread input must
+        # be discarded after the response instead of closing right away
+        self.checked_head: RequestHead | None = None
+        self.lingering = False
+
+    def flush(self: "_Channel") -> bool:
+        """
+        Writes as much of the outbox as the (non-blocking) socket takes.
+        Returns `True` once the outbox is empty.
+        """
+        outbox = self.outbox
+        while outbox:
+            if isinstance(outbox[0], FileRegion):
+                region = outbox[0]
+                try:
+                    region.send_some(self.socket)
+                except BlockingIOError:
+                    return False
+                if not region.count:
+                    outbox.popleft()
+                self.last_active = time.monotonic()
+                continue
+
+            # consecutive responses to pipelined requests leave in a single send
+            pieces = []
+            while outbox and not isinstance(outbox[0], FileRegion):
+                pieces.append(outbox.popleft())
+            data = pieces[0] if len(pieces) == 1 else b"".join(pieces) # type: ignore
+
+            try:
+                sent = self.socket.send(data) # type: ignore
+            except BlockingIOError:
+                outbox.appendleft(data) # type: ignore
+                return False
+            self.last_active = time.monotonic()
+            if sent < len(data): # type: ignore
+                outbox.appendleft(memoryview(data)[sent:]) # type: ignore
+                return False
+        return True
+
+    def close(self: "_Channel") -> None:
+        close_stream = getattr(self.body_stream, "close", None)
+        self.body_stream = None
+        self.outbox.clear()
+        try:
+            if close_stream is not None:
+                close_stream()
+        except Exception:
+            pass
+        try:
+            self.socket.close()
+        except OSError:
+            pass
@@ -0,0 +1,158 @@
+from typing import Callable, Iterator
+
+from zoe_http.request import Request
+from zoe_http.response import Response
+from zoe_http._response_util.response_stream import Stream
+from zoe_http._response_util.response_file import File
+from zoe_http.code import HttpCode
+from zoe_http._file_util import FileRegion
+from zoe_http._request_util.request_parser import RequestParser, RequestHead, ChunkedDecoder
+from zoe_http._request_util.request_body import RequestBody
+from zoe_application.application import App
+from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
+from zoe_exceptions.http_exceptions.exc_internal_exc import InternalServerException
+from zoe_exceptions.http_exceptions.exc_malformed_request import MalformedRequestException
+
+class _Exchange:
+    """Request/response round trip shared by `Server` and `AsyncServer`."""
+
+    CONTINUE: bytes = b"HTTP/1.1 100 Continue\r\n\r\n"
+
+    @staticmethod
+    def respond(
+            application: App,
+            head: RequestHead,
+            body: bytes | bytearray | RequestBody,
+            client_ip: str,
+            keep_alive_timeout: int,
+            closing: Callable[[], bool] | None = None,
+            headers_checked: bool = False
+        ) -> tuple[bytes, Iterator[bytes | FileRegion] | None, bool]:
+        """
+        Resolves one request. Returns the bytes to send first, the remaining body
+        pieces for streamed responses (`None` otherwise) and whether to keep the
+        connection open. While `closing()` is true the server is shutting down:
+        it is asked once the application answered, and the response then
+        carries `Connection: close`.
+        `headers_checked` tells that `check_headers()` already accepted the head.
+        A streamed `body` the application left unread is discarded, or the
+        connection closed when too much of it is left.
+        """
+        try:
+            client_request = Request.from_head(head=head, body=body, client_ip=client_ip)
+            response: Response = application._resolve(request=client_request, headers_checked=headers_checked)
+        except ZoeHttpException as exc:
+            response = exc.to_response()
+        except Exception as exc:
+            response = InternalServerException(detail=str(exc)).to_response()
+
+        # a shutdown may have begun while the application was running
+        keep_alive = head.keep_alive and not (closing is not None and closing())
+
+        if isinstance(body, RequestBody) and not body.finish():
+            keep_alive = False
+
+        if isinstance(response, File) and head.method == "GET":
+            response._negotiate_range(range_header=head.header("Range"), if_range=head.header("If-Range"))
+
+        if isinstance(response, Stream) and response._chunked and head.http_version != "HTTP/1.1":
+            response._close_delimited()
+            keep_alive = False
+
+        try:
+            payload = _Exchange.__with_connection(response, keep_alive, keep_alive_timeout)._build()
+        except ZoeHttpException as exc:
+            response = exc.to_response()
+            payload = _Exchange.__with_connection(response, keep_alive, keep_alive_timeout)._build()
+
+        return payload, response._body_stream(), keep_alive
+
+    @staticmethod
+    def stream_body(
+            head: RequestHead,
+            parser: RequestParser,
+            receive: Callable[[int], bytes],
+            max_size: int,
+            chunk_size: int
+        ) -> Iterator[bytes]:
+        """
+        Yields a request body while the application reads it: what the parser
+        already buffered, then what `receive(n)` gets from the connection
+        (`b""` once the peer closed it, `TimeoutError` when it stalls).
+        """
+        try:
+            if head.chunked:
+                decoder = ChunkedDecoder(parser=parser, max_size=max_size)
+                while not decoder.done:
+                    piece = decoder.read(limit=chunk_size)
+                    if piece is None:
+                        parser.feed(_Exchange.__receive(receive, chunk_size))
+                        continue
+                    yield piece
+                return
+
+            remaining = head.content_length
+            while remaining:
+                if parser.buffered:
+                    piece = parser.take(min(remaining, parser.buffered))
+                else:
+                    piece = _Exchange.__receive(receive, min(remaining, chunk_size))
+                remaining -= len(piece)
+                yield piece
+        except TimeoutError:
+            raise ZoeHttpException(message="Timed out reading the request body.", status_code=HttpCode.REQUEST_TIMEOUT)
+
+    @staticmethod
+    def __receive(receive: Callable[[int], bytes], n: int) -> bytes:
+        data = receive(n)
+        if not data:
+            raise MalformedRequestException("connection closed before the request body was complete.")
+        return data
+
+    @staticmethod
+    def check_headers(
+            application: App,
+            head: RequestHead,
+            client_ip: str
+        ) -> tuple[bytes, Iterator[bytes | FileRegion] | None] | None:
+        """
+        Header phase, run before the body is read: honours `Expect` and the
+        middlewares' `process_headers` hooks. Returns the rejection to send, with
+        `Connection: close` since the unread body cannot be skipped, or `None`
+        when the body may be read.
+        """
+        try:
+            expect = head.header("Expect")
+            if expect is not None and expect.lower() != "100-continue":
+                raise ZoeHttpException(
+                    message=f"Expectation '{expect}' is not supported.",
+                    status_code=HttpCode.EXPECTATION_FAILED
+                )
+            client_request = Request.from_head(head=head, body=b"", client_ip=client_ip)
+            response = application._check_headers(request=client_request)
+        except ZoeHttpException as exc:
+            response = exc.to_response()
+        except Exception as exc:
+            response = InternalServerException(detail=str(exc)).to_response()
+
+        if response is None:
+            return None
+        try:
+            payload = _Exchange.__with_connection(response, False, 0)._build()
+        except ZoeHttpException as exc:
+            response = exc.to_response()
+            payload = _Exchange.__with_connection(response, False, 0)._build()
+        return payload, response._body_stream()
+
+    @staticmethod
+    def __with_connection(response: Response, keep_alive: bool, keep_alive_timeout: int) -> Response:
+        if keep_alive:
+            response.add_header("Connection", "keep-alive")
+            response.add_header("Keep-Alive", f"timeout={keep_alive_timeout}")
+        else:
+            response.add_header("Connection", "close")
+        return response
+
+    @staticmethod
+    def reject(exc: ZoeHttpException) -> bytes:
+        return exc.to_response().add_header("Connection", "close")._build()
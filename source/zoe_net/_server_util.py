@@ -31,11 +31,12 @@ class _ServerUtil:
       ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠐⠀⠒⠲⠀⠀⡀⠰⠐⠁⠐⡀⠃{__RESET}"""
 
     @classmethod
-    def print_server_listening(cls, host: str, port: int) -> None:
+    def print_server_listening(cls, urls: list[str]) -> None:
+        addresses = f" {cls.__GRAY}·{cls.__RESET} ".join(f"{cls.__CYAN}{url}{cls.__RESET}" for url in urls)
         output = (
             f"{cls.__ZOE_ART}\n"
             f"            {cls.__BOLD}{cls.__GOLDEN}Zoe Framework{cls.__RESET} "
-            f"{cls.__GRAY}·{cls.__RESET} {cls.__CYAN}http://{host}:{port}{cls.__RESET}\n"
+            f"{cls.__GRAY}·{cls.__RESET} {addresses}\n"
             f"            {cls.__GRAY}ready to serve 🐾{cls.__RESET}\n"
         )
         print(output)
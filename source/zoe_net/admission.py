@@ -0,0 +1,143 @@
+import json
+import threading
+import time
+
+from zoe_http.code import HttpCode
+
+class AdmissionControl:
+    def __init__(
+            self: "AdmissionControl",
+            max_queue_depth: int = 0,
+            max_in_flight: int = 0,
+            queue_delay_target: float | None = None,
+            queue_delay_interval: float = 0.1,
+            retry_after: int = 1
+        ) -> None:
+        """
+        Load shedding policy for `Server`.
+        ---
+        Decides, for every accepted connection and every request that is ready to
+        be processed, whether it gets a worker or is turned away with a pre-built
+        `503 Service Unavailable` + `Retry-After`. Shed requests are never parsed
+        or routed, so shedding costs one `send`.
+
+        Requests are rejected when:
+        - `max_queue_depth` requests are already waiting for a worker;
+        - `max_in_flight` requests are already being processed;
+        - they waited in the queue longer than the adaptive queue-delay limit.
+
+        The queue-delay limit follows CoDel: while the *shortest* wait seen over the
+        last `queue_delay_interval` stays under `queue_delay_target` the queue is
+        considered healthy and a request may wait up to a whole interval; once even
+        the shortest wait exceeds the target, the server is overloaded and anything
+        waiting longer than the target is shed.
+
+        ---
+
+        *Args:*
+        - `max_queue_depth` *(int)* — Requests allowed to wait for a worker. `0` means unlimited.
+        - `max_in_flight` *(int)* — Requests processed at the same time. `0` means unlimited.
+        - `queue_delay_target` *(float | None)* — Acceptable queue wait in seconds
+        (e.g. `0.005`). `None` disables the queue-delay policy.
+        - `queue_delay_interval` *(float)* — CoDel interval in seconds. Defaults to `0.1`.
+        - `retry_after` *(int)* — Seconds sent in the `Retry-After` header. Defaults to `1`.
+
+        ---
+
+        *Example:*
+        ```python
+        from zoe import Server, AdmissionControl
+
+        Server(app, admission=AdmissionControl(
+            max_queue_depth=256,
+            queue_delay_target=0.005,
+        )).run()
+        ```
+        """
+        self.__max_queue_depth = max_queue_depth
+        self.__max_in_flight = max_in_flight
+        self.__target = queue_delay_target
+        self.__interval = queue_delay_interval
+        self.__rejection = self.__build_rejection(retry_after=retry_after)
+
+        self.__lock = threading.Lock()
+        self.__queued = 0
+        self.__in_flight = 0
+        self.__interval_ends_at = 0.0
+        self.__min_delay = float("inf")
+        self.__overloaded = False
+
+    @property
+    def rejection(self: "AdmissionControl") -> bytes:
+        return self.__rejection
+
+    @property
+    def queued(self: "AdmissionControl") -> int:
+        return self.__queued
+
+    @property
+    def in_flight(self: "AdmissionControl") -> int:
+        return self.__in_flight
+
+    def admits(self: "AdmissionControl") -> bool:
+        return not self.__saturated()
+
+    def try_enqueue(self: "AdmissionControl") -> bool:
+        with self.__lock:
+            if self.__saturated():
+                return False
+            self.__queued += 1
+            return True
+
+    def dequeue(self: "AdmissionControl", enqueued_at: float) -> bool:
+        now = time.monotonic()
+        with self.__lock:
+            self.__queued -= 1
+            if self.__target is None:
+                return True
+            return not self.__exceeds_queue_delay(delay=now - enqueued_at, now=now)
+
+    def begin_request(self: "AdmissionControl") -> None:
+        with self.__lock:
+            self.__in_flight += 1
+
+    def end_request(self: "AdmissionControl") -> None:
+        with self.__lock:
+            self.__in_flight -= 1
+
+    def __saturated(self: "AdmissionControl") -> bool:
+        if self.__max_queue_depth and self.__queued >= self.__max_queue_depth:
+            return True
+        return bool(self.__max_in_flight) and self.__in_flight >= self.__max_in_flight
+
+    def __exceeds_queue_delay(self: "AdmissionControl", delay: float, now: float) -> bool:
+        if now >= self.__interval_ends_at:
+            # judged on the interval that just ended: after a whole interval
+            # without requests (or before the first one) the queue is healthy
+            stale = now >= self.__interval_ends_at + self.__interval
+            self.__overloaded = not stale and self.__min_delay > self.__target # type: ignore
+            self.__min_delay = float("inf")
+            self.__interval_ends_at = now + self.__interval
+
+        self.__min_delay = min(self.__min_delay, delay)
+        limit = self.__target if self.__overloaded else self.__interval
+        return delay > limit # type: ignore
+
+    @staticmethod
+    def __build_rejection(retry_after: int) -> bytes:
+        status = HttpCode.SERVICE_UNAVAILABLE
+        body = json.dumps({
+            "error": {
+                "code": status.code,
+                "message": "Server is overloaded, please retry later."
+            }
+        }).encode("utf-8")
+
+        head = (
+            f"HTTP/1.1 {status.code} {status.message}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Retry-After: {retry_after}\r\n"
+            f"Connection: close\r\n\r\n"
+        ).encode("utf-8")
+        return head + body
@@ -0,0 +1,339 @@
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
+from zoe_net._server_util import _ServerUtil
+from zoe_net._exchange import _Exchange
+from zoe_application.application import App
+from zoe_http.bytes import Bytes
+from zoe_http._file_util import FileRegion
+from zoe_http._request_util.request_parser import RequestParser, RequestHead
+from zoe_http._request_util.request_body import RequestBody
+from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
+from zoe_exceptions.http_exceptions.exc_payload_too_large import PayloadTooLargeException
+
+class AsyncServer:
+    _CHUNK_SIZE: Bytes = Bytes.from_kb(n=64)
+    _DEFAULT_MAX_REQUEST_SIZE: Bytes = Bytes.from_mb(n=10)
+    _DEFAULT_SPOOL_THRESHOLD: Bytes = Bytes.from_mb(n=1)
+    _DEFAULT_KEEP_ALIVE_TIMEOUT_SECONDS: int = 30
+    _DEFAULT_MAX_WORKERS: int = 32
+    _DEFAULT_PIPELINE_DEPTH: int = 16
+    _LINGER_SECONDS: float = 2.0
+
+    def __init__(
+            self,
+            application: App,
+            host: str = "127.0.0.1",
+            port: int = 8080,
+            max_connections: int = 0,
+            max_workers: int = _DEFAULT_MAX_WORKERS,
+            max_request_size: Bytes = _DEFAULT_MAX_REQUEST_SIZE,
+            keep_alive_timeout: int = _DEFAULT_KEEP_ALIVE_TIMEOUT_SECONDS,
+            pipeline_depth: int = _DEFAULT_PIPELINE_DEPTH,
+            spool_threshold: Bytes = _DEFAULT_SPOOL_THRESHOLD
+          ) -> None:
+        """
+        Event-loop based alternative to `Server`.
+        ---
+        Every connection is served by a coroutine on a single `asyncio` loop, so
+        thousands of idle or slow keep-alive clients cost a few KB each instead of
+        a whole thread. Middlewares and handlers stay synchronous: each request is
+        resolved on a bounded thread pool and the loop only deals with socket I/O.
+
+        ---
+
+        *Args:*
+        - `max_connections` *(int)* — Maximum number of open connections. Extra
+        connections are closed right after `accept`. `0` means unlimited.
+        - `max_workers` *(int)* — Size of the thread pool that runs the
+        application. Defaults to `32`.
+        - `max_request_size` *(Bytes)* — Maximum size of a single request.
+        - `keep_alive_timeout` *(int)* — Seconds an idle connection is kept open.
+        - `pipeline_depth` *(int)* — Maximum number of pipelined responses queued
+        on a connection before they are flushed. Defaults to `16`.
+        - `spool_threshold` *(Bytes)* — Bodies larger than this (and chunked ones)
+        are not read ahead: the handler streams them with `request.stream()`,
+        and buffered access spools them to a temporary file. Defaults to 1 MB.
+
+        ---
+
+        *Example:*
+        ```python
+        from zoe import App, AsyncServer
+
+        app = App()
+        AsyncServer(app, max_workers=64).run()
+        ```
+        """
+        self.__app = application
+        self.__host = host
+        self.__port = port
+        self._max_connections = max_connections
+        self._max_workers = max_workers
+        self._max_request_size = max_request_size
+        self._keep_alive_timeout = keep_alive_timeout
+        self._pipeline_depth = max(1, pipeline_depth)
+        self._spool_threshold = spool_threshold
+        self.__active_connections: set[asyncio.StreamWriter] = set()
+        self.__executor: ThreadPoolExecutor | None = None
+
+        self._socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, port))
+
+    async def __fill(self, reader: asyncio.StreamReader, parser: RequestParser) -> bool:
+        chunk: bytes = await asyncio.wait_for(
+            reader.read(self._CHUNK_SIZE.value),
+            timeout=self._keep_alive_timeout
+        )
+        if not chunk:
+            return False
+        parser.feed(chunk)
+        return True
+
+    async def __read_head(self, reader: asyncio.StreamReader, parser: RequestParser) -> RequestHead | None:
+        try:
+            head = parser.parse_head()
+            while head is None:
+                if not await self.__fill(reader=reader, parser=parser):
+                    return None
+                head = parser.parse_head()
+            return head
+
+        except ZoeHttpException:
+            raise
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return None
+        except Exception:
+            return None
+
+    async def __check_head(
+            self,
+            writer: asyncio.StreamWriter,
+            head: RequestHead,
+            client_ip: str
+        ) -> bool:
+        """
+        Header phase of a request whose body has not fully arrived yet. Sends the
+        rejection or the `100 Continue` the client may be waiting for, and returns
+        whether the body should be read.
+        """
+        loop = asyncio.get_running_loop()
+        rejection = await loop.run_in_executor(
+            self.__executor,
+            _Exchange.check_headers,
+            self.__app,
+            head,
+            client_ip
+        )
+        if rejection is not None:
+            payload, body_stream = rejection
+            writer.write(payload)
+            if body_stream is not None:
+                await self.__send_stream(writer=writer, body_stream=body_stream)
+            return False
+
+        if head.expects_continue and (head.chunked or head.content_length <= self._max_request_size.value):
+            writer.write(_Exchange.CONTINUE)
+            await writer.drain()
+        return True
+
+    async def __linger(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # the request was answered before its body was read: closing with unread
+        # bytes makes the kernel send RST, which can destroy the response before
+        # the client reads it, so the rest of the input is discarded for a while
+        await writer.drain()
+        if not writer.can_write_eof():
+            return
+        writer.write_eof()
+        try:
+            await asyncio.wait_for(self.__discard(reader=reader), timeout=self._LINGER_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+    async def __discard(self, reader: asyncio.StreamReader) -> None:
+        while await reader.read(self._CHUNK_SIZE.value):
+            pass
+
+    async def __read_body(
+            self,
+            reader: asyncio.StreamReader,
+            parser: RequestParser,
+            head: RequestHead
+        ) -> bytearray | RequestBody | None:
+        try:
+            if head.content_length > self._max_request_size.value:
+                raise PayloadTooLargeException(max_size=self._max_request_size.value)
+
+            if head.chunked or head.content_length > self._spool_threshold.value:
+                source = _Exchange.stream_body(
+                    head=head,
+                    parser=parser,
+                    receive=self.__receive_from_loop(reader=reader),
+                    max_size=self._max_request_size.value,
+                    chunk_size=self._CHUNK_SIZE.value
+                )
+                return RequestBody(source=source, spool_threshold=self._spool_threshold.value)
+
+            body = bytearray(head.content_length)
+            view = memoryview(body)
+            filled = parser.take_into(view)
+            if filled < head.content_length:
+                view[filled:] = await asyncio.wait_for(
+                    reader.readexactly(head.content_length - filled),
+                    timeout=self._keep_alive_timeout
+                )
+            return body
+
+        except ZoeHttpException:
+            raise
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return None
+        except Exception:
+            return None
+
+    def __receive_from_loop(self, reader: asyncio.StreamReader) -> Callable[[int], bytes]:
+        loop = asyncio.get_running_loop()
+
+        def receive(n: int) -> bytes:
+            # called by the handler on a pool thread; the read itself runs on the loop
+            future = asyncio.run_coroutine_threadsafe(reader.read(n), loop)
+            try:
+                return future.result(timeout=self._keep_alive_timeout)
+            except TimeoutError:
+                future.cancel()
+                raise
+        return receive
+
+    async def __send_stream(self, writer: asyncio.StreamWriter, body_stream: Iterator[bytes | FileRegion]) -> bool:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    # the body generator is application code: advance it off the loop
+                    piece = await loop.run_in_executor(self.__executor, next, body_stream, None)
+                except Exception:
+                    return False
+                if piece is None:
+                    return True
+                if isinstance(piece, FileRegion):
+                    await writer.drain()
+                    if piece.count:
+                        await loop.sendfile(writer.transport, piece.file, offset=piece.offset, count=piece.count)
+                else:
+                    writer.write(piece)
+                    await writer.drain()
+        finally:
+            # a body left unfinished (the client went away) still releases its file
+            close_stream = getattr(body_stream, "close", None)
+            if close_stream is not None:
+                try:
+                    close_stream()
+                except Exception:
+                    pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self._max_connections > 0 and len(self.__active_connections) >= self._max_connections:
+            writer.close()
+            return
+
+        self.__active_connections.add(writer)
+        loop = asyncio.get_running_loop()
+        peer = writer.get_extra_info("peername")
+        client_ip: str = peer[0] if peer else ""
+
+        parser = RequestParser(max_head_size=self._max_request_size.value)
+        pipelined = 0
+
+        try:
+            while True:
+                try:
+                    head = await self.__read_head(reader=reader, parser=parser)
+                    if head is None:
+                        break
+                    # fully buffered requests go through the header phase in `App._resolve`
+                    headers_checked = head.has_body and (head.chunked or parser.buffered < head.content_length)
+                    if headers_checked and not await self.__check_head(writer=writer, head=head, client_ip=client_ip):
+                        await self.__linger(reader=reader, writer=writer)
+                        break
+                    body = await self.__read_body(reader=reader, parser=parser, head=head)
+                except ZoeHttpException as exc:
+                    writer.write(_Exchange.reject(exc))
+                    await self.__linger(reader=reader, writer=writer)
+                    break
+
+                if body is None:
+                    break
+
+                try:
+                    payload, body_stream, keep_alive = await loop.run_in_executor(
+                        self.__executor,
+                        _Exchange.respond,
+                        self.__app,
+                        head,
+                        body,
+                        client_ip,
+                        self._keep_alive_timeout,
+                        None,
+                        headers_checked
+                    )
+                except Exception:
+                    break
+
+                # pipelined responses are queued in request order and flushed together
+                writer.write(payload)
+                pipelined += 1
+                if body_stream is not None:
+                    pipelined = 0
+                    if not await self.__send_stream(writer=writer, body_stream=body_stream):
+                        break
+                elif pipelined >= self._pipeline_depth or not parser.has_complete_request():
+                    await writer.drain()
+                    pipelined = 0
+
+                if isinstance(body, RequestBody) and not body.complete:
+                    # too much of the body was left unread to skip it
+                    await self.__linger(reader=reader, writer=writer)
+                    break
+                if not keep_alive:
+                    break
+
+            await writer.drain()
+
+        except (ConnectionError, OSError):
+            pass
+
+        finally:
+            self.__active_connections.discard(writer)
+            writer.close()
+
+    async def serve(self) -> None:
+        self._socket.listen(128)
+        self._socket.setblocking(False)
+        self.__executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        server = await asyncio.start_server(
+            self._handle,
+            sock=self._socket
+        )
+
+        _ServerUtil.print_server_listening(urls=[f"http://{self.__host}:{self.__port}"])
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for writer in list(self.__active_connections):
+                writer.close()
+            self.__active_connections.clear()
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self) -> None:
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            _ServerUtil.print_server_shutdown()
+        finally:
+            self._socket.close()
@@ -0,0 +1,159 @@
+import errno
+import os
+import socket
+import stat
+
+from zoe_http.bytes import Bytes
+
+class Listener:
+    _DEFAULT_BACKLOG: int = 1024
+
+    def __init__(
+            self: "Listener",
+            host: str = "127.0.0.1",
+            port: int = 8080,
+            path: str | None = None,
+            fd: int | None = None,
+            backlog: int = _DEFAULT_BACKLOG,
+            mode: int | None = None,
+            nodelay: bool = True,
+            defer_accept: int | None = None,
+            send_buffer: Bytes | None = None,
+            receive_buffer: Bytes | None = None
+        ) -> None:
+        """
+        An address `Server` accepts connections on.
+        ---
+        A listener is either a TCP address (`host` / `port`, IPv6 when `host`
+        contains a `:`), a Unix domain socket (`path`), or an already listening
+        socket inherited from the parent process (`fd`, e.g. systemd socket
+        activation).
+
+        ---
+
+        *Args:*
+        - `host` *(str)* — Address to bind (`"0.0.0.0"`, `"::"`, ...). Defaults to `"127.0.0.1"`.
+        - `port` *(int)* — TCP port. Defaults to `8080`.
+        - `path` *(str | None)* — Unix domain socket path. A stale socket file is replaced; one
+        a running server still listens on is not.
+        - `fd` *(int | None)* — Inherited listening socket to adopt instead of binding.
+        - `backlog` *(int)* — Pending connection queue length. Defaults to `1024`
+        (the kernel caps it at `net.core.somaxconn`).
+        - `mode` *(int | None)* — Permissions of the Unix socket file (e.g. `0o660`).
+        - `nodelay` *(bool)* — Set `TCP_NODELAY` on accepted TCP connections. Defaults to `True`.
+        - `defer_accept` *(int | None)* — Seconds for `TCP_DEFER_ACCEPT` (Linux): only
+        wake the server once the client has sent data.
+        - `send_buffer` / `receive_buffer` *(Bytes | None)* — `SO_SNDBUF` / `SO_RCVBUF`,
+        inherited by accepted connections.
+
+        ---
+
+        *Example:*
+        ```python
+        from zoe import Server, Listener, Bytes
+
+        Server(app, listeners=[
+            Listener(host="::", port=8080, backlog=4096),
+            Listener(path="/run/zoe.sock", mode=0o660),
+        ]).run()
+        ```
+        """
+        if path is not None and fd is not None:
+            raise ValueError("Listener accepts either 'path' or 'fd', not both.")
+        self.__host = host
+        self.__port = port
+        self.__path = path
+        self.__fd = fd
+        self.__backlog = backlog
+        self.__mode = mode
+        self.__nodelay = nodelay
+        self.__defer_accept = defer_accept
+        self.__send_buffer = send_buffer
+        self.__receive_buffer = receive_buffer
+        self.__family = socket.AF_UNIX if path is not None else socket.AF_INET6 if ":" in host else socket.AF_INET
+
+    @property
+    def url(self: "Listener") -> str:
+        if self.__path is not None:
+            return f"unix:{self.__path}"
+        if self.__fd is not None:
+            return f"fd://{self.__fd}"
+        host = f"[{self.__host}]" if self.__family == socket.AF_INET6 else self.__host
+        return f"http://{host}:{self.__port}"
+
+    def open(self: "Listener", inherited_fd: int | None = None) -> socket.socket:
+        """Binds the listener, or adopts `inherited_fd` (a restart hand-over) or the configured `fd`."""
+        fd = inherited_fd if inherited_fd is not None else self.__fd
+        if fd is not None:
+            sock = socket.socket(fileno=fd)
+            self.__family = sock.family
+            return sock
+
+        sock = socket.socket(family=self.__family, type=socket.SOCK_STREAM)
+        try:
+            self.__apply_options(sock)
+            if self.__path is not None:
+                self.__bind_unix(sock=sock, path=self.__path)
+            else:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind((self.__host, self.__port))
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def listen(self: "Listener", sock: socket.socket) -> None:
+        sock.listen(self.__backlog)
+        if self.__defer_accept and self.__family != socket.AF_UNIX and hasattr(socket, "TCP_DEFER_ACCEPT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_DEFER_ACCEPT, self.__defer_accept)
+
+    def configure(self: "Listener", conn_socket: socket.socket) -> None:
+        """Applies per-connection options to a socket returned by `accept()`."""
+        if self.__nodelay and self.__family != socket.AF_UNIX:
+            conn_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def close(self: "Listener", sock: socket.socket, unlink: bool = True) -> None:
+        sock.close()
+        if unlink and self.__path is not None and self.__fd is None:
+            try:
+                os.unlink(self.__path)
+            except OSError:
+                pass
+
+    def __apply_options(self: "Listener", sock: socket.socket) -> None:
+        # set before listen(): the receive buffer decides the TCP window scale
+        if self.__send_buffer is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.__send_buffer.value)
+        if self.__receive_buffer is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.__receive_buffer.value)
+
+    def __bind_unix(self: "Listener", sock: socket.socket, path: str) -> None:
+        self.__remove_stale_socket_file(path=path)
+        sock.bind(path)
+        if self.__mode is not None:
+            os.chmod(path, self.__mode)
+
+    @staticmethod
+    def __remove_stale_socket_file(path: str) -> None:
+        """
+        Removes the socket file a crashed server left behind. A socket file a
+        live server still accepts on is left alone: binding fails with `EADDRINUSE`.
+        """
+        try:
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                return
+        except FileNotFoundError:
+            return
+
+        probe = socket.socket(family=socket.AF_UNIX, type=socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            # nobody listens on it anymore
+            os.unlink(path)
+            return
+        except FileNotFoundError:
+            return
+        finally:
+            probe.close()
+        raise OSError(errno.EADDRINUSE, f"Another server is listening on '{path}'.")
@@ -1,20 +1,44 @@
+import gc
+import os
+import queue
+import selectors
+import signal
 import socket
+import subprocess
+import sys
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from types import FrameType
+from typing import Any, Callable
 
 from zoe_net._server_util import _ServerUtil
-from zoe_http.request import Request
-from zoe_http.response import Response
+from zoe_net._exchange import _Exchange
+from zoe_net._channel import _Channel
+from zoe_net.admission import AdmissionControl
+from zoe_net.listener import Listener
 from zoe_net.connection import Connection
 from zoe_application.application import App
-from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
-from zoe_exceptions.http_exceptions.exc_internal_exc import InternalServerException
 from zoe_http.bytes import Bytes
+from zoe_http._request_util.request_parser import RequestParser, RequestHead
+from zoe_http._request_util.request_body import RequestBody
+from zoe_exceptions.http_exceptions.exc_http_base import ZoeHttpException
+from zoe_exceptions.http_exceptions.exc_payload_too_large import PayloadTooLargeException
+
+# what `signal.signal()` returns for the handler it replaces
+_SignalHandler = Callable[[int, FrameType | None], Any] | int | None
 
 class Server:
-    _CHUNK_SIZE: Bytes = Bytes.from_kb(n=4)
+    _CHUNK_SIZE: Bytes = Bytes.from_kb(n=64)
     _DEFAULT_MAX_REQUEST_SIZE: Bytes = Bytes.from_mb(n=10)
+    _DEFAULT_SPOOL_THRESHOLD: Bytes = Bytes.from_mb(n=1)
     _DEFAULT_KEEP_ALIVE_TIMEOUT_SECONDS: int = 30
+    _DEFAULT_PIPELINE_DEPTH: int = 16
+    _DEFAULT_MAX_WORKERS: int = 32
+    _DEFAULT_DRAIN_TIMEOUT_SECONDS: float = 30.0
+    _WORKER_RESPAWN_DELAY_SECONDS: float = 1.0
+    _LINGER_SECONDS: float = 2.0
+    _LISTEN_FDS_ENV: str = "ZOE_LISTEN_FDS"
 
     def __init__(
             self,
@@ -22,144 +46,616 @@ class Server:
             host: str = "127.0.0.1",
             port: int = 8080,
             max_connections: int = 0,
+            max_workers: int = _DEFAULT_MAX_WORKERS,
             max_request_size: Bytes = _DEFAULT_MAX_REQUEST_SIZE,
-            keep_alive_timeout: int = _DEFAULT_KEEP_ALIVE_TIMEOUT_SECONDS
+            keep_alive_timeout: int = _DEFAULT_KEEP_ALIVE_TIMEOUT_SECONDS,
+            workers: int = 1,
+            cpu_affinity: bool = False,
+            pipeline_depth: int = _DEFAULT_PIPELINE_DEPTH,
+            admission: AdmissionControl | None = None,
+            drain_timeout: float = _DEFAULT_DRAIN_TIMEOUT_SECONDS,
+            listeners: list[Listener] | None = None,
+            spool_threshold: Bytes = _DEFAULT_SPOOL_THRESHOLD
           ) -> None:
         self.__app = application
-        self.__host = host
-        self.__port = port
         self._max_connections = max_connections
+        self._max_workers = max_workers
         self._max_request_size = max_request_size
         self._keep_alive_timeout = keep_alive_timeout
+        self._workers = workers
+        self._cpu_affinity = cpu_affinity
+        self._pipeline_depth = max(1, pipeline_depth)
+        self._admission = admission or AdmissionControl()
+        self._drain_timeout = drain_timeout
+        self._spool_threshold = spool_threshold
         self.__running = False
-        self.__active_connections: list[socket.socket] = []
-        self.__connections_lock = threading.Lock()
+        self.__stop_requested = False
+        self.__drain_deadline: float | None = None
+        self.__handed_over = False
+        self.__channels: set[_Channel] = set()
+        self.__returned: queue.SimpleQueue[_Channel] = queue.SimpleQueue()
+        self.__view = memoryview(bytearray(self._CHUNK_SIZE.value))
+
+        # a process started by a zero-downtime restart adopts its parent's listening sockets
+        inherited = os.environ.pop(self._LISTEN_FDS_ENV, "")
+        inherited_fds = [int(fd) for fd in inherited.split(",") if fd]
+        self._listeners = listeners or [Listener(host=host, port=port)]
+        self._sockets = [
+            listener.open(inherited_fd=inherited_fds[i] if i < len(inherited_fds) else None)
+            for i, listener in enumerate(self._listeners)
+        ]
 
-        self._socket = socket.socket(family=socket.AF_INET, type=socket.SOCK_STREAM)
-        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._socket.bind((host, port))
+    def __read_body(self, conn_socket: socket.socket, parser: RequestParser, length: int) -> bytearray | None:
+        body = bytearray(length)
+        view = memoryview(body)
+        filled = parser.take_into(view)
+        while filled < length:
+            received = conn_socket.recv_into(view[filled:])
+            if not received:
+                return None
+            filled += received
+        return body
 
-    def __read_request(self, conn_socket: socket.socket) -> str | None:
+    def __streams_body(self, head: RequestHead) -> bool:
+        return head.chunked or head.content_length > self._spool_threshold.value
+
+    def __read_request(self, conn_socket: socket.socket, parser: RequestParser) -> tuple[RequestHead, bytearray | RequestBody] | None:
         conn_socket.settimeout(self._keep_alive_timeout)
-        raw: bytes = b""
 
         try:
-            while b"\r\n\r\n" not in raw:
-                chunk: bytes = conn_socket.recv(self._CHUNK_SIZE.value)
-                if not chunk:
-                    return None
-                raw += chunk
-                if len(raw) > self._max_request_size.value:
-                    return None
-
-            header_part, _, body_part = raw.partition(b"\r\n\r\n")
-
-            content_length = 0
-            for line in header_part.decode("utf-8", errors="replace").splitlines():
-                if line.lower().startswith("content-length:"):
-                    content_length = int(line.split(":", 1)[1].strip())
-                    break
-
-            while len(body_part) < content_length:
-                remaining = content_length - len(body_part)
-                chunk: bytes = conn_socket.recv(min(self._CHUNK_SIZE.value, remaining))
-                if not chunk:
-                    break
-                body_part += chunk
-
-            return (header_part + b"\r\n\r\n" + body_part).decode("utf-8", errors="replace")
+            # the reactor only dispatches a channel once its request head is buffered
+            head = parser.parse_head()
+            if head is None:
+                return None
+
+            if head.content_length > self._max_request_size.value:
+                raise PayloadTooLargeException(max_size=self._max_request_size.value)
+            if self.__streams_body(head):
+                source = _Exchange.stream_body(
+                    head=head,
+                    parser=parser,
+                    receive=conn_socket.recv,
+                    max_size=self._max_request_size.value,
+                    chunk_size=self._CHUNK_SIZE.value
+                )
+                return head, RequestBody(source=source, spool_threshold=self._spool_threshold.value)
+
+            body = self.__read_body(conn_socket=conn_socket, parser=parser, length=head.content_length)
+            if body is None:
+                return None
+            return head, body
 
+        except ZoeHttpException:
+            raise
         except socket.timeout:
             return None
         except Exception:
             return None
 
-    def __should_keep_alive(self, raw_data: str) -> bool:
-        for line in raw_data.splitlines():
-            if line.lower().startswith("connection:"):
-                return "keep-alive" in line.lower()
-        if "HTTP/1.1" in raw_data.split("\r\n")[0]:
+    def __is_ready(self, channel: _Channel) -> bool:
+        parser = channel.parser
+        if parser.has_complete_request():
             return True
-        return False
+        # large and chunked bodies are streamed, and oversized ones rejected, by the
+        # worker; a head whose body is still on its way first goes through the header phase
+        head = parser.peek_head()
+        return head is not None and (
+            self.__streams_body(head)
+            or head.content_length > self._max_request_size.value
+            or channel.checked_head is not head
+        )
 
-    def __close_active_connections(self) -> None:
-        with self.__connections_lock:
-            for sock in self.__active_connections:
+    def __check_head(self, channel: _Channel, head: RequestHead) -> bool:
+        """
+        Runs the header phase before the body is read. Queues the rejection, or the
+        `100 Continue` the client may be waiting for, and returns whether the
+        body should be read.
+        """
+        channel.checked_head = head
+        rejection = _Exchange.check_headers(application=self.__app, head=head, client_ip=channel.client_ip)
+        if rejection is not None:
+            channel.outbox.append(rejection[0])
+            channel.body_stream = rejection[1]
+            channel.keep_alive = False
+            channel.lingering = True
+            return False
+
+        if head.expects_continue and (head.chunked or head.content_length <= self._max_request_size.value):
+            channel.outbox.append(_Exchange.CONTINUE)
+        return True
+
+    def __serve_request(self, channel: _Channel) -> None:
+        parser = channel.parser
+        head = parser.peek_head()
+        if head is not None and channel.checked_head is not head and not parser.has_complete_request():
+            if not self.__check_head(channel=channel, head=head):
+                return
+            if not self.__streams_body(head) and head.content_length <= self._max_request_size.value:
+                # the reactor reads the body and dispatches the channel once it is complete
+                return
+            if channel.outbox:
+                # the body is read while the application runs: the client must see the 100 Continue first
                 try:
-                    sock.close()
-                except Exception:
+                    channel.socket.settimeout(self._keep_alive_timeout)
+                    channel.socket.sendall(b"".join(channel.outbox)) # type: ignore
+                except OSError:
+                    channel.keep_alive = False
+                    return
+                channel.outbox.clear()
+
+        try:
+            received = self.__read_request(conn_socket=channel.socket, parser=parser)
+        except ZoeHttpException as exc:
+            channel.outbox.append(_Exchange.reject(exc))
+            channel.keep_alive = False
+            channel.lingering = True
+            return
+
+        if received is None:
+            channel.keep_alive = False
+            return
+
+        head, body = received
+
+        self._admission.begin_request()
+        try:
+            payload, body_stream, keep_alive = _Exchange.respond(
+                application=self.__app,
+                head=head,
+                body=body,
+                client_ip=channel.client_ip,
+                keep_alive_timeout=self._keep_alive_timeout,
+                closing=self.__closing,
+                headers_checked=channel.checked_head is head
+            )
+        except Exception:
+            channel.keep_alive = False
+            return
+        finally:
+            self._admission.end_request()
+
+        channel.outbox.append(payload)
+        channel.body_stream = body_stream
+        channel.keep_alive = keep_alive
+        channel.lingering = isinstance(body, RequestBody) and not body.complete
+        channel.served += 1
+
+    def __pump(self, channel: _Channel) -> bool:
+        """Writes the outbox and advances the body stream until done (`True`) or the socket is full."""
+        channel.socket.setblocking(False)
+        while True:
+            if not channel.flush():
+                return False
+            if channel.body_stream is None:
+                return True
+            piece = next(channel.body_stream, None)
+            if piece is None:
+                channel.body_stream = None
+            else:
+                channel.outbox.append(piece)
+
+    def __work(self, channel: _Channel) -> bool:
+        served = 0
+        while True:
+            while (
+                channel.keep_alive
+                and channel.body_stream is None
+                and served < self._pipeline_depth
+                and self.__is_ready(channel)
+            ):
+                self.__serve_request(channel)
+                served += 1
+
+            if not self.__pump(channel):
+                # the client reads slower than we write: the reactor finishes the job
+                return True
+            if not (channel.keep_alive and served < self._pipeline_depth and self.__is_ready(channel)):
+                return channel.keep_alive or channel.lingering
+
+    def _handle(self, channel: _Channel) -> None:
+        if channel.enqueued_at is not None and not self._admission.dequeue(enqueued_at=channel.enqueued_at):
+            self.__shed(channel=channel)
+            return
+
+        try:
+            alive = self.__running and self.__work(channel)
+        except Exception:
+            # also a failing body stream: its head is already on the wire, so the
+            # only way left to signal the error is to drop the connection
+            alive = False
+
+        if alive:
+            self.__hand_back(channel=channel)
+        else:
+            self.__close(channel=channel)
+            if self.__drain_deadline is not None:
+                # the reactor is waiting for the last connections to end
+                self.__wake()
+
+    def __hand_back(self, channel: _Channel) -> None:
+        self.__returned.put(channel)
+        self.__wake()
+
+    def __wake(self) -> None:
+        try:
+            self.__wakeup_writer.send(b"\0")
+        except OSError:
+            # the pipe is full, so a wakeup is already pending
+            pass
+
+    def __shed(self, channel: _Channel) -> None:
+        # the request is never processed: a pre-built 503 is all an overloaded server can afford
+        self.__channels.discard(channel)
+        conn_socket = channel.socket
+        try:
+            with conn_socket:
+                conn_socket.setblocking(True)
+                conn_socket.sendall(self._admission.rejection)
+                conn_socket.shutdown(socket.SHUT_WR)
+                # closing with unread bytes makes the kernel send RST, which can
+                # destroy the 503 before the client reads it: discard what arrived
+                conn_socket.setblocking(False)
+                while conn_socket.recv(self._CHUNK_SIZE.value):
                     pass
-            self.__active_connections.clear()
+        except OSError:
+            pass
+
+    def __close(self, channel: _Channel) -> None:
+        self.__channels.discard(channel)
+        channel.close()
 
-    def _handle(self, conn: Connection) -> None:
-        with self.__connections_lock:
-            self.__active_connections.append(conn.socket_connection)
+    # --- reactor: everything below runs on the thread that called run() ---
 
+    def __park(self, channel: _Channel, events: int) -> None:
+        if channel.events == events:
+            return
+        if channel.events:
+            self.__selector.modify(channel.socket, events, channel)
+        else:
+            self.__selector.register(channel.socket, events, channel)
+        channel.events = events
+
+    def __unpark(self, channel: _Channel) -> None:
+        if channel.events:
+            self.__selector.unregister(channel.socket)
+            channel.events = 0
+
+    def __dispatch(self, channel: _Channel, admit: bool) -> None:
+        self.__unpark(channel)
+        if not admit:
+            channel.enqueued_at = None
+        elif self._admission.try_enqueue():
+            channel.enqueued_at = time.monotonic()
+        else:
+            self.__shed(channel=channel)
+            return
+        self.__pool.submit(self._handle, channel)
+
+    def __resume(self, channel: _Channel) -> None:
+        if channel.outbox:
+            self.__park(channel, selectors.EVENT_WRITE)
+        elif channel.body_stream is not None:
+            # advancing the stream runs application code: back to a worker
+            self.__dispatch(channel, admit=False)
+        elif channel.lingering:
+            self.__linger(channel=channel)
+        elif not channel.keep_alive or (self.__drain_deadline is not None and self.__is_idle(channel)):
+            self.__unpark(channel)
+            self.__close(channel=channel)
+        elif self.__is_ready(channel):
+            self.__dispatch(channel, admit=True)
+        else:
+            self.__park(channel, selectors.EVENT_READ)
+
+    def __linger(self, channel: _Channel) -> None:
+        # the request was answered before its body was read: closing with unread
+        # bytes makes the kernel send RST, which can destroy the response before
+        # the client reads it, so the rest of the input is discarded for a while
         try:
-            with conn.socket_connection:
-                while self.__running:
-                    raw_data = self.__read_request(conn.socket_connection)
+            channel.socket.shutdown(socket.SHUT_WR)
+        except OSError:
+            self.__unpark(channel)
+            self.__close(channel=channel)
+            return
+        channel.last_active = time.monotonic()
+        self.__park(channel, selectors.EVENT_READ)
 
-                    if not raw_data or not raw_data.strip():
-                        break
+    def __accept(self, listening_socket: socket.socket, listener: Listener) -> bool:
+        try:
+            conn = Connection.bootstrap(listening_socket.accept())
+        except (BlockingIOError, InterruptedError):
+            return False
+        try:
+            listener.configure(conn.socket_connection)
+        except OSError:
+            conn.socket_connection.close()
+            return True
 
-                    client_ip: str = conn.socket_address[0]  # type: ignore
-                    keep_alive = self.__should_keep_alive(raw_data)
-
-                    try:
-                        client_request = Request(raw_data=raw_data, client_ip=client_ip)
-                        response = self.__app._resolve(request=client_request)
-                    except ZoeHttpException as exc:
-                        response = exc.to_response()
-                    except Exception as exc:
-                        response = InternalServerException(detail=str(exc)).to_response()
-
-                    if keep_alive:
-                        response.add_header("Connection", "keep-alive")
-                        response.add_header("Keep-Alive", f"timeout={self._keep_alive_timeout}")
-                    else:
-                        response.add_header("Connection", "close")
-
-                    try:
-                        conn.socket_connection.sendall(response._build())
-                    except Exception:
-                        break
+        channel = _Channel(conn=conn, max_head_size=self._max_request_size.value)
+        if self._max_connections > 0 and len(self.__channels) >= self._max_connections:
+            channel.close()
+        elif not self._admission.admits():
+            self.__shed(channel=channel)
+        else:
+            self.__channels.add(channel)
+            channel.socket.setblocking(False)
+            self.__park(channel, selectors.EVENT_READ)
+        return True
 
-                    if not keep_alive:
-                        break
+    def __on_readable(self, channel: _Channel) -> None:
+        try:
+            received = channel.socket.recv_into(self.__view)
+        except BlockingIOError:
+            return
+        except OSError:
+            received = 0
 
-        finally:
-            with self.__connections_lock:
-                try:
-                    self.__active_connections.remove(conn.socket_connection)
-                except ValueError:
+        if not received:
+            self.__unpark(channel)
+            self.__close(channel=channel)
+            return
+        if channel.lingering:
+            return
+
+        channel.parser.feed(self.__view[:received])
+        channel.last_active = time.monotonic()
+        if self.__is_ready(channel):
+            self.__dispatch(channel, admit=True)
+
+    def __on_writable(self, channel: _Channel) -> None:
+        try:
+            flushed = channel.flush()
+        except Exception:
+            self.__unpark(channel)
+            self.__close(channel=channel)
+            return
+        if flushed:
+            self.__resume(channel)
+
+    def __on_wakeup(self) -> None:
+        try:
+            while self.__wakeup_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        while not self.__returned.empty():
+            self.__resume(self.__returned.get_nowait())
+
+    def __sweep_idle(self) -> None:
+        now = time.monotonic()
+        for key in list(self.__selector.get_map().values()):
+            channel = key.data
+            if not isinstance(channel, _Channel):
+                continue
+            timeout = self._LINGER_SECONDS if channel.lingering else self._keep_alive_timeout
+            if channel.last_active < now - timeout:
+                self.__unpark(channel)
+                self.__close(channel=channel)
+
+    def __close_all(self) -> None:
+        for channel in list(self.__channels):
+            channel.close()
+        self.__channels.clear()
+
+    def __begin_drain(self) -> None:
+        self.__drain_deadline = time.monotonic() + self._drain_timeout
+
+        # connections that already completed the handshake are served, not reset
+        for listener, listening_socket in zip(self._listeners, self._sockets):
+            self.__selector.unregister(listening_socket)
+            try:
+                while self.__accept(listening_socket=listening_socket, listener=listener):
                     pass
+            except OSError:
+                pass
+        self.__close_listeners(unlink=False)
 
-    def run(self) -> None:
+        # idle keep-alive connections have nothing to finish: close them now
+        for key in list(self.__selector.get_map().values()):
+            channel = key.data
+            if isinstance(channel, _Channel) and channel.events == selectors.EVENT_READ and self.__is_idle(channel):
+                self.__unpark(channel)
+                self.__close(channel=channel)
+
+    def __closing(self) -> bool:
+        return self.__stop_requested or self.__drain_deadline is not None
+
+    def __is_idle(self, channel: _Channel) -> bool:
+        # between two requests on a keep-alive connection, as opposed to a fresh one
+        return channel.served > 0 and not channel.parser.buffered
+
+    def __drained(self) -> bool:
+        return not self.__channels or time.monotonic() >= self.__drain_deadline # type: ignore
+
+    def __request_stop(self, signum: int, frame: object) -> None:
+        if self.__stop_requested and self._workers <= 1:
+            # a second Ctrl+C does not wait for the drain
+            raise KeyboardInterrupt
+        self.__stop_requested = True
+        self.__wake()
+
+    def __request_restart(self, signum: int, frame: object) -> None:
+        self.__spawn_successor()
+        self.__request_stop(signum=signum, frame=frame)
+
+    def __spawn_successor(self) -> None:
+        """Starts a copy of this process that adopts the listening sockets (zero-downtime restart)."""
+        fds = [listening_socket.fileno() for listening_socket in self._sockets]
+        for fd in fds:
+            os.set_inheritable(fd, True)
+        subprocess.Popen(
+            [sys.executable, *sys.orig_argv[1:]],
+            env={**os.environ, self._LISTEN_FDS_ENV: ",".join(map(str, fds))},
+            pass_fds=fds,
+            start_new_session=True
+        )
+        self.__handed_over = True
+
+    def __listen(self) -> None:
+        for listener, listening_socket in zip(self._listeners, self._sockets):
+            listener.listen(listening_socket)
+
+    def __close_listeners(self, unlink: bool) -> None:
+        # Unix socket files stay in place for a successor that adopted them
+        for listener, listening_socket in zip(self._listeners, self._sockets):
+            listener.close(listening_socket, unlink=unlink and not self.__handed_over)
+
+    def __announce(self) -> None:
+        _ServerUtil.print_server_listening(urls=[listener.url for listener in self._listeners])
+
+    def __install_signal_handlers(self, standalone: bool) -> dict[int, _SignalHandler]:
+        """Installs the stop and restart handlers. Returns the ones they replaced."""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        handlers: dict[int, Callable[[int, FrameType | None], Any] | int] = {signal.SIGTERM: self.__request_stop, signal.SIGINT: self.__request_stop}
+        if hasattr(signal, "SIGUSR2"):
+            # in a pre-forked worker, restarts are the supervisor's job
+            handlers[signal.SIGUSR2] = self.__request_restart if standalone else signal.SIG_IGN
+        return {signum: signal.signal(signum, handler) for signum, handler in handlers.items()}
+
+    def __serve(self, standalone: bool) -> None:
         self.__running = True
-        self._socket.settimeout(1.0)
-        self._socket.listen(128)
+        self.__selector: selectors.BaseSelector = selectors.DefaultSelector()
+        self.__wakeup_reader, self.__wakeup_writer = socket.socketpair()
+        self.__wakeup_reader.setblocking(False)
+        self.__wakeup_writer.setblocking(False)
+        self.__selector.register(self.__wakeup_reader, selectors.EVENT_READ)
 
-        max_workers = self._max_connections if self._max_connections > 0 else None
+        if standalone:
+            self.__listen()
+        for listener, listening_socket in zip(self._listeners, self._sockets):
+            listening_socket.setblocking(False)
+            self.__selector.register(listening_socket, selectors.EVENT_READ, listener)
+        previous_handlers = self.__install_signal_handlers(standalone=standalone)
 
-        _ServerUtil.print_server_listening(host=self.__host, port=self.__port)
+        if standalone:
+            self.__announce()
 
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            self.__pool: ThreadPoolExecutor = pool
+            swept_at = time.monotonic()
             try:
                 while self.__running:
-                    try:
-                        conn = Connection.bootstrap(self._socket.accept())
-                        pool.submit(self._handle, conn)
-                    except socket.timeout:
-                        continue
-                    except OSError:
+                    for key, events in self.__selector.select(timeout=1.0):
+                        if key.fileobj is self.__wakeup_reader:
+                            self.__on_wakeup()
+                        elif isinstance(key.data, Listener):
+                            self.__accept(listening_socket=key.fileobj, listener=key.data) # type: ignore
+                        elif events & selectors.EVENT_READ:
+                            self.__on_readable(key.data)
+                        else:
+                            self.__on_writable(key.data)
+
+                    if self.__stop_requested and self.__drain_deadline is None:
+                        self.__begin_drain()
+                    if self.__drain_deadline is not None and self.__drained():
                         break
 
+                    if time.monotonic() - swept_at >= 1.0:
+                        self.__sweep_idle()
+                        swept_at = time.monotonic()
+
             except KeyboardInterrupt:
-                self.__running = False
-                self.__close_active_connections()
-                _ServerUtil.print_server_shutdown()
+                pass
 
             finally:
+                self.__running = False
+                for signum, handler in previous_handlers.items():
+                    # `None`: the handler was not installed from Python, there is nothing to put back
+                    if handler is not None:
+                        signal.signal(signum, handler)
                 pool.shutdown(wait=False, cancel_futures=True)
-                self._socket.close()
+                self.__close_all()
+                self.__selector.close()
+                self.__wakeup_reader.close()
+                self.__wakeup_writer.close()
+                self.__close_listeners(unlink=standalone)
+                if standalone:
+                    _ServerUtil.print_server_shutdown()
+
+    def __pin_to_cpu(self, slot: int) -> None:
+        if not hasattr(os, "sched_setaffinity"):
+            return
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+
+    def __spawn_worker(self, slot: int) -> int:
+        pid = os.fork()
+        if pid != 0:
+            return pid
+
+        exit_code = 0
+        try:
+            if self._cpu_affinity:
+                self.__pin_to_cpu(slot=slot)
+            self.__serve(standalone=False)
+        except BaseException:
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def __run_workers(self) -> None:
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Server(workers=N) requires os.fork(), which is not available on this platform.")
+
+        self.__running = True
+        self.__listen()
+
+        # Everything imported so far (the app, its routers and handlers) is shared
+        # with the workers; keep the GC from touching it so pages stay copy-on-write.
+        gc.collect()
+        gc.freeze()
+
+        self.__announce()
+
+        workers: dict[int, tuple[int, float]] = {}
+        for slot in range(self._workers):
+            workers[self.__spawn_worker(slot=slot)] = (slot, time.monotonic())
+
+        previous_sigterm = signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+        previous_sigusr2 = signal.signal(signal.SIGUSR2, self.__restart_workers) if hasattr(signal, "SIGUSR2") else None
+        try:
+            while self.__running:
+                pid, _ = os.wait()
+                if pid not in workers:
+                    continue
+
+                slot, started_at = workers.pop(pid)
+                if time.monotonic() - started_at < self._WORKER_RESPAWN_DELAY_SECONDS:
+                    time.sleep(self._WORKER_RESPAWN_DELAY_SECONDS)
+                workers[self.__spawn_worker(slot=slot)] = (slot, time.monotonic())
+
+        except KeyboardInterrupt:
+            self.__running = False
+
+        finally:
+            signal.signal(signal.SIGTERM, previous_sigterm)
+            if previous_sigusr2 is not None:
+                signal.signal(signal.SIGUSR2, previous_sigusr2)
+            # workers drain their in-flight requests before exiting
+            self.__close_listeners(unlink=True)
+            for pid in workers:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            for pid in workers:
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    pass
+            _ServerUtil.print_server_shutdown()
+
+    def __restart_workers(self, signum: int, frame: object) -> None:
+        self.__spawn_successor()
+        raise KeyboardInterrupt
+
+    def run(self) -> None:
+        if self._workers > 1:
+            self.__run_workers()
+        else:
+            self.__serve(standalone=True)
+
+
+def _raise_keyboard_interrupt(signum: int, frame: object) -> None:
+    raise KeyboardInterrupt
@@ -1,5 +1,9 @@
 from zoe_http.method import HttpMethod
 from zoe_http.handler import Handler
+from zoe_http.response import Response
+from zoe_http.request import Request
+from zoe_application.handler_invoker import HandlerInvoker, InvocationPlan
+from zoe_handlers.constant_handler import ConstantHandler
 
 class Route:
     def __init__(self: "Route", endpoint: str, method: HttpMethod, handler: Handler) -> None:
@@ -8,6 +12,9 @@ class Route:
         self.__endpoint = endpoint
         self.__method = method
         self.__handler = handler
+        # type hints are read once, on the first request rather than here:
+        # annotations may name types defined after the route is created
+        self.__plan: InvocationPlan | None = None
 
     @staticmethod
     def post(endpoint: str, handler: Handler) -> "Route":
@@ -29,6 +36,27 @@ class Route:
     def patch(endpoint: str, handler: Handler) -> "Route":
         return Route(endpoint=endpoint, method=HttpMethod.PATCH, handler=handler)
 
+    @staticmethod
+    def constant(endpoint: str, response: Response, method: HttpMethod = HttpMethod.GET) -> "Route":
+        """
+        A route that always answers `response`, serialized once here: requests
+        are served from those bytes, with no handler invocation.
+        ---
+
+        *Example:*
+        ```python
+        app.use(Route.constant("/robots.txt", Response.text(HttpCode.OK, "User-agent: *\nDisallow: /")))
+        ```
+        """
+        return Route(endpoint=endpoint, method=method, handler=ConstantHandler(response=response))
+
+    def _invoke(self: "Route", request: Request) -> Response:
+        plan = self.__plan
+        if plan is None:
+            plan = HandlerInvoker.plan(handler=self.__handler)
+            self.__plan = plan
+        return plan.invoke(request=request)
+
     @property
     def handler(self: "Route") -> Handler:
         return self.__handler
@@ -0,0 +1,138 @@
+import re
+from typing import Generic, Iterable, TypeVar
+
+from zoe_http.method import HttpMethod
+
+T = TypeVar("T")
+
+class _Node(Generic[T]):
+    __slots__ = ("static", "param", "wildcards", "methods")
+
+    def __init__(self: "_Node") -> None:
+        self.static: dict[str, _Node[T]] = {}
+        self.param: _Node[T] | None = None
+        # (text before the `*` in the segment, node of the routes ending there)
+        self.wildcards: list[tuple[str, _Node[T]]] = []
+        # method -> (target, names of the path parameters, in path order)
+        self.methods: dict[HttpMethod, tuple[T, tuple[str, ...]]] = {}
+
+
+class RouteTree(Generic[T]):
+    """
+    Routes compiled into a trie of path segments.
+    ---
+    Static segments are looked up in a dict, then the `{param}` edge, then the
+    `*` edges are tried, backtracking when a branch dead-ends: a lookup costs
+    the depth of the path, not the number of routes. Each node holds a table
+    of methods, which tells a path that exists for other methods (405) from
+    one that does not exist (404). When two routes share a path and a method,
+    the first one added wins.
+    """
+    __PARAM = re.compile(r"^\{\w+\}$")
+
+    def __init__(self: "RouteTree") -> None:
+        self.__root: _Node[T] = _Node()
+        # fully static paths skip the walk
+        self.__static: dict[str, _Node[T]] = {}
+
+    @staticmethod
+    def compile(routes: Iterable[tuple[str, HttpMethod, T]]) -> "RouteTree[T]":
+        tree: RouteTree[T] = RouteTree()
+        for path, method, target in routes:
+            tree.add(path=path, method=method, target=target)
+        return tree
+
+    def add(self: "RouteTree", path: str, method: HttpMethod, target: T) -> None:
+        path = self.__normalize(path=path)
+        node = self.__root
+        names: list[str] = []
+        static = True
+
+        for segment in path.split("/"):
+            if "*" in segment:
+                # the wildcard takes the rest of the path, whatever follows it in the pattern
+                prefix = segment.replace("*", "")
+                leaf = next((n for p, n in node.wildcards if p == prefix), None)
+                if leaf is None:
+                    leaf = _Node()
+                    node.wildcards.append((prefix, leaf))
+                node = leaf
+                names.append("wildcard")
+                static = False
+                break
+            if self.__PARAM.match(segment):
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+                names.append(segment[1:-1])
+                static = False
+            else:
+                node = node.static.setdefault(segment, _Node())
+
+        node.methods.setdefault(method, (target, tuple(names)))
+        if static:
+            self.__static[path] = node
+
+    def match(self: "RouteTree", path: str, method: HttpMethod) -> tuple[T | None, dict[str, str], set[HttpMethod]]:
+        """
+        Returns the target of the route serving `method` on `path` with its path
+        parameters or, when there is none, the methods `path` exists for.
+        """
+        path = self.__normalize(path=path)
+        node = self.__static.get(path)
+        if node is not None:
+            entry = node.methods.get(method)
+            if entry is not None:
+                return entry[0], {}, set()
+
+        allowed: set[HttpMethod] = set()
+        found = self.__find(node=self.__root, segments=path.split("/"), index=0, values=[], method=method, allowed=allowed)
+        if found is None:
+            return None, {}, allowed
+        (target, names), values = found
+        return target, dict(zip(names, values)), set()
+
+    def __find(
+            self: "RouteTree",
+            node: _Node[T],
+            segments: list[str],
+            index: int,
+            values: list[str],
+            method: HttpMethod,
+            allowed: set[HttpMethod]
+        ) -> tuple[tuple[T, tuple[str, ...]], list[str]] | None:
+        if index == len(segments):
+            entry = node.methods.get(method)
+            if entry is not None:
+                return entry, values
+            allowed.update(node.methods)
+            return None
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self.__find(child, segments, index + 1, values, method, allowed)
+            if found is not None:
+                return found
+
+        if node.param is not None:
+            found = self.__find(node.param, segments, index + 1, values + [segment], method, allowed)
+            if found is not None:
+                return found
+
+        if node.wildcards:
+            rest = "/".join(segments[index:])
+            for prefix, leaf in node.wildcards:
+                if not rest.startswith(prefix):
+                    continue
+                entry = leaf.methods.get(method)
+                if entry is not None:
+                    return entry, values + [rest[len(prefix):].lstrip("/")]
+                allowed.update(leaf.methods)
+        return None
+
+    @staticmethod
+    def __normalize(path: str) -> str:
+        if len(path) > 1 and path.endswith("/"):
+            return path[:-1]
+        return path
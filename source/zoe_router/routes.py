@@ -1,31 +1,24 @@
 from zoe_router.route import Route
 
 class Routes:
+    # bumped whenever a route is added to any `Routes`: route trees compiled before it are rebuilt
+    __generation: int = 0
+
     def __init__(self: "Routes") -> None:
         self.__routes_container: list[Route] = []
 
     @property
-    def routes(self: "Routes") -> list[Route]:
-        return self.__routes_container
+    def routes(self: "Routes") -> tuple[Route, ...]:
+        return tuple(self.__routes_container)
 
     def add(self: "Routes", route: Route) -> "Routes":
         self.__routes_container.append(route)
+        Routes.__generation += 1
         return self
 
-    def prioritize_static_routes(self: "Routes") -> None:
-      static: list[Route] = []
-      parametrized: list[Route] = []
-      wildcard_routes: list[Route] = []
-
-      for r in self.__routes_container:
-        if r.endpoint.__contains__("{"):
-            parametrized.append(r)
-        elif r.endpoint.__contains__("/*"):
-            wildcard_routes.append(r)
-        else:
-            static.append(r)
-
-      self.__routes_container = static + parametrized + wildcard_routes
+    @staticmethod
+    def _generation() -> int:
+        return Routes.__generation
 
     def __iter__(self):
         return iter(self.__routes_container)
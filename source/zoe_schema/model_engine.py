@@ -6,23 +6,43 @@ from zoe_exceptions.schemas_exceptions.exc_aggregate import ZoeSchemaAggregateEx
 from zoe_schema.schema_validators.not_null import NotNull
 from zoe_schema.field_schema_validator import FieldValidator
 
-from typing import Any
+from typing import Any, Callable
 import typing
 import types
 
+# (validate, whether it also runs on a null value)
+_ValidatorStep = tuple[Callable[..., None], bool]
+# (field name, accepted types or None for any, accepts null, annotation, validators)
+_FieldPlan = tuple[str, tuple[type, ...] | None, bool, Any, tuple[_ValidatorStep, ...]]
+
 class ModelEngine:
+    # validation plan of each model class, compiled on its first validation
+    __plans: dict[type[Model], tuple[_FieldPlan, ...]] = {}
+
     @staticmethod
     def validate_and_create(model_class: type[Model], data: dict) -> Model:
-        hints: dict = typing.get_type_hints(model_class)
+        plan = ModelEngine.__plans.get(model_class)
+        if plan is None:
+            plan = ModelEngine.__compile(model_class=model_class)
+            ModelEngine.__plans[model_class] = plan
 
-        type_errors = ModelEngine.__validate_model_types(hints=hints, data=data)
-        fields_with_type_errors = {e.field_name for e in type_errors}
+        type_errors: list[ZoeSchemaException] = []
+        validator_errors: list[ZoeSchemaException] = []
 
-        validator_errors = ModelEngine.__run_validators(
-            class_dict=model_class.__dict__,
-            data=data,
-            skip_fields=fields_with_type_errors
-        )
+        for field_name, accepted, nullable, expected, validators in plan:
+            value = data.get(field_name)
+            if field_name in data and accepted is not None and type(value) not in accepted and not (value is None and nullable):
+                type_errors.append(SchemaTypeError(field_name=field_name, expected=expected, actual=type(value)))
+                continue
+
+            for validate, runs_on_null in validators:
+                if value is None and not runs_on_null:
+                    continue
+                try:
+                    validate(value=value, field_name=field_name)
+                except ZoeSchemaException as exc:
+                    validator_errors.append(exc)
+                    break
 
         errors = [*type_errors, *validator_errors]
         if errors:
@@ -31,17 +51,39 @@ class ModelEngine:
         return model_class(**data)
 
     @staticmethod
-    def __is_optional(hint: type) -> bool:
-            origin = ModelEngine.__get_base_type(hint)
-            if origin is typing.Union or origin == types.UnionType:
-                args = typing.get_args(hint)
-                return type(None) in args or type(types.UnionType) in args
-            return False
+    def __compile(model_class: type[Model]) -> tuple[_FieldPlan, ...]:
+        hints: dict = typing.get_type_hints(model_class)
+        hints.pop("return", None)
+
+        fields: dict[str, Field] = model_class._fields()
+
+        plan: list[_FieldPlan] = []
+        for field_name in [*hints, *(name for name in fields if name not in hints)]:
+            expected = hints.get(field_name, Any)
+            accepted, nullable = ModelEngine.__accepted_types(hint=expected)
+            validators = fields[field_name].validators if field_name in fields else ()
+            plan.append((
+                field_name,
+                accepted,
+                nullable,
+                expected,
+                tuple(ModelEngine.__validator_step(validator=v, field_name=field_name) for v in validators)
+            ))
+        return tuple(plan)
 
     @staticmethod
-    def __contains_multiple_internal_types(hint: type) -> bool:
-            return typing.get_args(hint).__sizeof__() > 0
-
+    def __accepted_types(hint: Any) -> tuple[tuple[type, ...] | None, bool]:
+        """Exact types a value of the field may have (`None`: any), and whether it may be null."""
+        if hint is Any:
+            return None, True
+        origin = typing.get_origin(hint)
+        if origin is typing.Union or origin is types.UnionType:
+            args = typing.get_args(hint)
+            if Any in args:
+                return None, True
+            accepted = tuple(ModelEngine.__get_base_type(hint=arg) for arg in args if arg is not type(None))
+            return accepted, type(None) in args
+        return (ModelEngine.__get_base_type(hint=hint),), False
 
     @staticmethod
     def __get_base_type(hint: type) -> Any:
@@ -49,64 +91,10 @@ class ModelEngine:
         return origin if origin is not None else hint
 
     @staticmethod
-    def __validate_model_types(hints: dict[str, type], data: dict) -> list[ZoeSchemaException]:
-        type_errors: list[ZoeSchemaException] = []
-
-        for field_name, expected_type in hints.items():
-            if field_name == "return":
-                continue
-            if field_name not in data:
-                continue
-
-            actual_type = type(data[field_name])
-            base_expected = ModelEngine.__get_base_type(hint=expected_type)
-
-            if actual_type != base_expected:
-                if ModelEngine.__is_optional(hint=typing.get_origin(expected_type)) and data[field_name] is None: # type: ignore
-                    continue
-
-                if ModelEngine.__contains_multiple_internal_types(hint=base_expected):
-                    args: tuple = typing.get_args(tp=base_expected)
-                    if expected_type in args:
-                        continue
-
-                type_errors.append(SchemaTypeError(
-                    field_name=field_name,
-                    expected=expected_type,
-                    actual=actual_type
-                ))
-
-        return type_errors
-
-    @staticmethod
-    def __run_validators(
-        class_dict: dict[str, type],
-        data: dict,
-        skip_fields: set[str] = set()
-    ) -> list[ZoeSchemaException]:
-        errors: list[ZoeSchemaException] = []
-        skip_fields = skip_fields or set()
-
-        for attr_name, attr_class in class_dict.items():
-            if isinstance(attr_class, Field):
-                if attr_name in skip_fields:
-                    continue
-
-                value = data.get(attr_name, None)
-
-                for validator in attr_class.validators:
-                    try:
-                        if hasattr(validator, 'validate'):
-                            if not isinstance(validator, NotNull) and value is None:
-                                continue
-                            validator.validate(value=value, field_name=attr_name)
-                        else:
-                            raise TypeError(
-                                f"Validator '{type(validator).__name__}' on field '{attr_name}' "
-                                f"must implement 'validate()' or be callable."
-                            )
-                    except ZoeSchemaException as exc:
-                        errors.append(exc)
-                        break
-
-        return errors
+    def __validator_step(validator: FieldValidator, field_name: str) -> _ValidatorStep:
+        if not hasattr(validator, 'validate'):
+            raise TypeError(
+                f"Validator '{type(validator).__name__}' on field '{field_name}' "
+                f"must implement 'validate()' or be callable."
+            )
+        return validator.validate, isinstance(validator, NotNull)
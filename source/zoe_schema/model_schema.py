@@ -1,22 +1,100 @@
-from typing import Any
-from typing import get_type_hints
-
-class Model:
-  def __init__(self: "Model", **kwargs):
-    hints = get_type_hints(type(self))
-    for field in hints:
-      if field not in kwargs:
-        setattr(self, field, None)
+from typing import TYPE_CHECKING, Any, Callable
+from zoe_schema.field_schema import Field
+from zoe_exceptions.schemas_exceptions.exc_schema import SchemaError
+
+class _ModelMeta(type):
+  """
+  Builds every `Model` class compact and cheap to instantiate.
+  ---
+  The annotated fields become `__slots__`, and `__init__` / `to_dict` are
+  generated for exactly those fields when the class is created, so making
+  an instance is one plain call with no type-hint lookup. The `Field`
+  declarations are moved off the class (a slot cannot share its name with a
+  class attribute) into `Model._fields()`, where `ModelEngine` reads them.
+
+  Slots limit inheritance: a model can extend models along one line, but not
+  two models that each declare fields of their own (`SchemaError`). Base
+  models without fields can be mixed in freely.
+  """
+  def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> type:
+    mcs.__check_layout(name=name, bases=bases)
+
+    names: list[str] = []
+    fields: dict[str, Field] = {}
+    for base in reversed(bases):
+      names += [n for n in getattr(base, "_Model__field_names", ()) if n not in names]
+      fields.update(getattr(base, "_Model__fields", {}))
+
+    own: list[str] = []
+    for field_name in namespace.get("__annotations__", {}):
+      if field_name not in names:
+        names.append(field_name)
+        own.append(field_name)
+      # class-level values cannot live beside the slots: instances start at None
+      value = namespace.pop(field_name, None)
+      if isinstance(value, Field):
+        fields[field_name] = value
+    for attr_name, attr_value in namespace.items():
+      if isinstance(attr_value, Field):
+        fields[attr_name] = attr_value
+
+    namespace.setdefault("__slots__", tuple(own))
+    namespace["_Model__field_names"] = tuple(names)
+    namespace["_Model__fields"] = fields
+    if "__init__" not in namespace:
+      # keys of the body that are not fields are ignored, missing fields are None
+      parameters = "".join(f"{n}=None, " for n in names)
+      namespace["__init__"] = mcs.__generate(
+        f"def __init__(__model, {'*, ' if names else ''}{parameters}**__ignored):\n"
+        + "".join(f"  __model.{n} = {n}\n" for n in names)
+        + "  pass\n",
+        "__init__"
+      )
+    if "to_dict" not in namespace:
+      namespace["to_dict"] = mcs.__generate(
+        "def to_dict(__model):\n"
+        f"  return {{{', '.join(f'{n!r}: __model.{n}' for n in names)}}}\n",
+        "to_dict"
+      )
+    return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+  @staticmethod
+  def __check_layout(name: str, bases: tuple[type, ...]) -> None:
+    # each base holding fields in slots fixes the instance layout: two unrelated ones cannot be combined
+    slotted: list[type] = []
+    for base in bases:
+      holder = next((k for k in base.__mro__ if k.__dict__.get("__slots__")), None)
+      if holder is None or any(issubclass(other, holder) for other in slotted):
         continue
-      setattr(self, field, kwargs[field])
+      slotted = [other for other in slotted if not issubclass(holder, other)] + [holder]
+    if len(slotted) > 1:
+      raise SchemaError(
+        f"Model '{name}' cannot extend {', '.join(repr(k.__name__) for k in slotted)}: "
+        f"they each declare fields of their own. Declare those fields in one base model "
+        f"and extend that one instead."
+      )
+
+  @staticmethod
+  def __generate(source: str, function_name: str) -> Callable:
+    scope: dict[str, Any] = {}
+    exec(source, {}, scope)
+    return scope[function_name]
+
+
+class Model(metaclass=_ModelMeta):
+  if TYPE_CHECKING:
+    # generated for each model class by `_ModelMeta`: declared here for type checkers only
+    def __init__(self: "Model", **kwargs: Any) -> None: ...
+    def to_dict(self: "Model") -> dict[str, Any]: ...
 
   def __getattr__(self: "Model", name: str) -> Any:
     raise AttributeError(f"'{type(self).__name__}' has no field '{name}'")
 
-  def to_dict(self: "Model") -> dict:
-    return self.__dict__
+  @classmethod
+  def _fields(cls) -> dict[str, Field]:
+    """The `Field` declared for each field, base models' included."""
+    return cls.__fields # type: ignore
 
   @classmethod
   def is_model(cls, class_reference: type) -> bool:
     return issubclass(class_reference, Model)
-
@@ -0,0 +1,104 @@
+import pytest
+
+from zoe import AdmissionControl
+from zoe_net import admission
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(admission.time, "monotonic", clock)
+    return clock
+
+
+def waited(control: AdmissionControl, clock: Clock, delay: float) -> bool:
+    """Queue one request that waited `delay` seconds for a worker."""
+    assert control.try_enqueue()
+    return control.dequeue(enqueued_at=clock.now - delay)
+
+
+def test_rejection_is_a_complete_503_with_retry_after():
+    head, _, body = AdmissionControl(retry_after=7).rejection.partition(b"\r\n\r\n")
+    lines = head.split(b"\r\n")
+
+    assert lines[0] == b"HTTP/1.1 503 Service Unavailable"
+    assert b"Retry-After: 7" in lines
+    assert b"Connection: close" in lines
+    assert f"Content-Length: {len(body)}".encode() in lines
+    assert b"overloaded" in body
+
+
+def test_unlimited_by_default():
+    control = AdmissionControl()
+    for _ in range(1000):
+        assert control.try_enqueue()
+        control.begin_request()
+    assert control.admits()
+    assert (control.queued, control.in_flight) == (1000, 1000)
+
+
+def test_queue_depth_limit():
+    control = AdmissionControl(max_queue_depth=2)
+    assert control.try_enqueue() and control.try_enqueue()
+    assert not control.try_enqueue()
+    assert not control.admits()
+    assert control.queued == 2
+
+    assert control.dequeue(enqueued_at=0.0)  # no queue-delay policy
+    assert control.admits() and control.try_enqueue()
+
+
+def test_in_flight_limit():
+    control = AdmissionControl(max_in_flight=1)
+    control.begin_request()
+    assert not control.admits() and not control.try_enqueue()
+
+    control.end_request()
+    assert control.in_flight == 0
+    assert control.admits() and control.try_enqueue()
+
+
+def test_healthy_queue_tolerates_waits_up_to_an_interval(clock: Clock):
+    control = AdmissionControl(queue_delay_target=0.005, queue_delay_interval=0.1)
+    assert waited(control, clock, delay=0.05)
+    assert not waited(control, clock, delay=0.2)
+    assert control.queued == 0
+
+
+def test_standing_queue_sheds_waits_over_the_target(clock: Clock):
+    control = AdmissionControl(queue_delay_target=0.005, queue_delay_interval=0.1)
+    # even the shortest wait of a whole interval stays over the target
+    for _ in range(3):
+        assert waited(control, clock, delay=0.02)
+        clock.now += 0.04
+    clock.now += 0.001
+
+    assert not waited(control, clock, delay=0.02)
+    assert waited(control, clock, delay=0.001)
+
+
+def test_one_short_wait_keeps_the_queue_healthy(clock: Clock):
+    control = AdmissionControl(queue_delay_target=0.005, queue_delay_interval=0.1)
+    assert waited(control, clock, delay=0.02)
+    assert waited(control, clock, delay=0.001)
+    clock.now += 0.1
+
+    assert waited(control, clock, delay=0.02)
+
+
+def test_queue_is_healthy_again_after_an_idle_interval(clock: Clock):
+    control = AdmissionControl(queue_delay_target=0.005, queue_delay_interval=0.1)
+    assert waited(control, clock, delay=0.02)
+    clock.now += 0.1
+    assert not waited(control, clock, delay=0.02)
+
+    clock.now += 1.0
+    assert waited(control, clock, delay=0.02)
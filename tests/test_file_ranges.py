@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import pytest
+
+from zoe import HttpCode
+from zoe_http._response_util.response_file import File
+from zoe_http._file_util import FileRegion
+
+CONTENT = bytes(range(256)) * 4  # 1024 bytes
+
+
+@pytest.fixture
+def directory(tmp_path: Path) -> str:
+    (tmp_path / "data.bin").write_bytes(CONTENT)
+    return str(tmp_path)
+
+
+def serve(directory: str, range_header: str | None, if_range: str | None = None) -> tuple[File, bytes, bytes]:
+    """The response, its head and its body as the server would send them."""
+    response = File(HttpCode.OK, filename="data.bin", directory=directory)
+    response._negotiate_range(range_header=range_header, if_range=if_range)
+    head = response._build()
+
+    body = b""
+    for part in response._body_stream():
+        if isinstance(part, FileRegion):
+            part.file.seek(part.offset)
+            part = part.file.read(part.count)
+        body += part
+    return response, head, body
+
+
+def header(head: bytes, name: str) -> str | None:
+    for line in head.decode("latin-1").split("\r\n")[1:]:
+        field, _, value = line.partition(":")
+        if field.lower() == name.lower():
+            return value.strip()
+    return None
+
+
+def test_without_range_the_whole_file_is_sent(directory: str):
+    response, head, body = serve(directory, range_header=None)
+    assert response.status_code == HttpCode.OK
+    assert header(head, "Accept-Ranges") == "bytes"
+    assert header(head, "Content-Length") == "1024"
+    assert body == CONTENT
+
+
+@pytest.mark.parametrize(("range_header", "start", "end"), [
+    ("bytes=0-99", 0, 99),
+    ("bytes=1000-", 1000, 1023),
+    ("bytes=1000-5000", 1000, 1023),
+    ("bytes=-24", 1000, 1023),
+    ("bytes=-5000", 0, 1023),
+])
+def test_single_range(directory: str, range_header: str, start: int, end: int):
+    response, head, body = serve(directory, range_header=range_header)
+    assert response.status_code == HttpCode.PARTIAL_CONTENT
+    assert header(head, "Content-Range") == f"bytes {start}-{end}/1024"
+    assert header(head, "Content-Length") == str(end - start + 1)
+    assert body == CONTENT[start:end + 1]
+
+
+def test_multiple_ranges_are_sent_as_multipart(directory: str):
+    response, head, body = serve(directory, range_header="bytes=0-9, -10")
+    assert response.status_code == HttpCode.PARTIAL_CONTENT
+
+    content_type = header(head, "Content-Type")
+    assert content_type is not None and content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.partition("boundary=")[2]
+    assert header(head, "Content-Length") == str(len(body))
+    assert body == (
+        f"\r\n--{boundary}\r\nContent-Type: application/octet-stream\r\n"
+        f"Content-Range: bytes 0-9/1024\r\n\r\n".encode() + CONTENT[:10]
+        + f"\r\n--{boundary}\r\nContent-Type: application/octet-stream\r\n"
+        f"Content-Range: bytes 1014-1023/1024\r\n\r\n".encode() + CONTENT[-10:]
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+
+
+def test_overlapping_ranges_are_merged(directory: str):
+    response, head, body = serve(directory, range_header="bytes=50-99,0-9,5-60")
+    assert response.status_code == HttpCode.PARTIAL_CONTENT
+    assert header(head, "Content-Range") == "bytes 0-99/1024"
+    assert body == CONTENT[:100]
+
+
+@pytest.mark.parametrize("range_header", ["bytes=1024-", "bytes=5000-6000", "bytes=-0"])
+def test_unsatisfiable_range_is_416(directory: str, range_header: str):
+    response, head, body = serve(directory, range_header=range_header)
+    assert response.status_code == HttpCode.RANGE_NOT_SATISFIABLE
+    assert header(head, "Content-Range") == "bytes */1024"
+    assert header(head, "Content-Length") == "0"
+    assert body == b""
+
+
+@pytest.mark.parametrize("range_header", [
+    "items=0-9", "bytes=", "bytes=9-0", "bytes=a-9", "bytes=-", "bytes=0-9;x",
+    "bytes=" + ",".join(f"{i * 10}-{i * 10 + 1}" for i in range(17)),
+])
+def test_invalid_range_is_ignored(directory: str, range_header: str):
+    response, head, body = serve(directory, range_header=range_header)
+    assert response.status_code == HttpCode.OK
+    assert header(head, "Content-Range") is None
+    assert body == CONTENT
+
+
+def test_if_range_must_match_the_current_validators(directory: str):
+    _, head, _ = serve(directory, range_header=None)
+    etag, last_modified = header(head, "ETag"), header(head, "Last-Modified")
+
+    for validator in (etag, last_modified):
+        response, _, body = serve(directory, range_header="bytes=0-9", if_range=validator)
+        assert response.status_code == HttpCode.PARTIAL_CONTENT
+        assert body == CONTENT[:10]
+
+    response, _, body = serve(directory, range_header="bytes=0-9", if_range='"stale"')
+    assert response.status_code == HttpCode.OK
+    assert body == CONTENT
+
+
+def test_file_is_closed_when_the_body_is_never_sent(directory: str):
+    response = File(HttpCode.OK, filename="data.bin", directory=directory)
+    response._build()
+    stream = response._body_stream()
+    stream.close()  # type: ignore[attr-defined]
+
+    # a second stream over the same parts exposes the file the first one held
+    region = next(response._body_stream())
+    assert isinstance(region, FileRegion) and region.file.closed
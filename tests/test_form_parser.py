@@ -0,0 +1,172 @@
+import pytest
+
+from zoe_http._request_util import form_parser
+from zoe_http._request_util.form_parser import MultipartParser, UrlencodedParser
+from zoe_http._request_util.upload_file import UploadFile
+from zoe_http._request_util.form_params import FormParams
+from zoe_exceptions.http_exceptions.exc_malformed_request import MalformedRequestException
+from zoe_exceptions.http_exceptions.exc_payload_too_large import PayloadTooLargeException
+
+BOUNDARY = "zoe-boundary"
+
+BODY = (
+    b"this preamble is ignored\r\n"
+    b"--zoe-boundary\r\n"
+    b'Content-Disposition: form-data; name="title"\r\n'
+    b"\r\n"
+    b"hello --zoe-bound world\r\n"
+    b"--zoe-boundary\r\n"
+    b'Content-Disposition: form-data; name="upload"; filename="a.bin"\r\n'
+    b"Content-Type: application/octet-stream\r\n"
+    b"\r\n"
+    b"\x00\r\n\x01\r\n--zoe\r\n"
+    b"--zoe-boundary--\r\n"
+    b"this epilogue is ignored too\r\n"
+)
+
+
+@pytest.fixture
+def uploads(monkeypatch: pytest.MonkeyPatch) -> list[UploadFile]:
+    """Every `UploadFile` the parser creates."""
+    created: list[UploadFile] = []
+
+    class RecordedUploadFile(UploadFile):
+        __slots__ = ()
+
+        def __init__(self, field_name: str, filename: str, content_type: str) -> None:
+            super().__init__(field_name=field_name, filename=filename, content_type=content_type)
+            created.append(self)
+
+    monkeypatch.setattr(form_parser, "UploadFile", RecordedUploadFile)
+    return created
+
+
+def parse_multipart(pieces: list[bytes], **kwargs) -> FormParams:
+    parser = MultipartParser(boundary=BOUNDARY, **kwargs)
+    for piece in pieces:
+        parser.feed(piece)
+    return parser.close()
+
+
+def test_multipart_in_one_piece_skips_preamble_and_epilogue():
+    params = parse_multipart([BODY])
+
+    assert params["title"] == "hello --zoe-bound world"
+    upload = params["upload"]
+    assert isinstance(upload, UploadFile)
+    assert (upload.filename, upload.content_type) == ("a.bin", "application/octet-stream")
+    assert upload.read() == b"\x00\r\n\x01\r\n--zoe"
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 16])
+def test_multipart_with_delimiters_split_across_feeds(size: int):
+    params = parse_multipart([BODY[i:i + size] for i in range(0, len(BODY), size)])
+
+    assert params["title"] == "hello --zoe-bound world"
+    assert params["upload"].read() == b"\x00\r\n\x01\r\n--zoe"
+
+
+def test_multipart_repeated_fields_are_all_kept():
+    body = (
+        b"--zoe-boundary\r\n"
+        b'Content-Disposition: form-data; name="tag"\r\n\r\na\r\n'
+        b"--zoe-boundary\r\n"
+        b'Content-Disposition: form-data; name="tag"\r\n\r\nb\r\n'
+        b"--zoe-boundary--"
+    )
+    params = parse_multipart([body])
+    assert params["tag"] == "b"
+    assert params.get_all("tag") == ["a", "b"]
+
+
+def test_multipart_without_closing_boundary_is_rejected(uploads: list[UploadFile]):
+    parser = MultipartParser(boundary=BOUNDARY)
+    parser.feed(BODY[:BODY.index(b"--zoe-boundary--")])
+
+    with pytest.raises(MalformedRequestException):
+        parser.close()
+    assert uploads and all(upload.file.closed for upload in uploads)
+
+
+def test_multipart_text_field_over_the_limit_is_rejected():
+    body = (
+        b"--zoe-boundary\r\n"
+        b'Content-Disposition: form-data; name="text"\r\n\r\n'
+        + b"x" * 100 + b"\r\n--zoe-boundary--"
+    )
+    with pytest.raises(PayloadTooLargeException):
+        parse_multipart([body], max_field_size=10)
+
+
+def test_multipart_part_headers_over_the_limit_are_rejected():
+    body = b"--zoe-boundary\r\nX-Filler: " + b"x" * (MultipartParser._MAX_PART_HEADER_SIZE + 1)
+    with pytest.raises(PayloadTooLargeException):
+        parse_multipart([body])
+
+
+def test_multipart_part_without_a_name_is_rejected():
+    body = b"--zoe-boundary\r\nContent-Disposition: form-data\r\n\r\nx\r\n--zoe-boundary--"
+    with pytest.raises(MalformedRequestException):
+        parse_multipart([body])
+
+
+def test_multipart_uploads_are_closed_when_parsing_fails_mid_part(uploads: list[UploadFile]):
+    # a finished upload, then one still being written when a broken delimiter arrives
+    failing = (
+        b"--zoe-boundary\r\n"
+        b'Content-Disposition: form-data; name="first"; filename="1.bin"\r\n\r\n'
+        b"one\r\n"
+        b"--zoe-boundary\r\n"
+        b'Content-Disposition: form-data; name="second"; filename="2.bin"\r\n\r\n'
+        b"two, still going"
+    )
+    parser = MultipartParser(boundary=BOUNDARY)
+    parser.feed(failing)
+    assert len(uploads) == 2 and not any(upload.file.closed for upload in uploads)
+
+    with pytest.raises(MalformedRequestException):
+        parser.feed(b"\r\n--zoe-boundary??")
+    assert all(upload.file.closed for upload in uploads)
+
+
+def test_multipart_uploads_are_closed_when_a_field_is_too_large(uploads: list[UploadFile]):
+    body = (
+        b"--zoe-boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="1.bin"\r\n\r\n'
+        b"one\r\n"
+        b"--zoe-boundary\r\n"
+        b'Content-Disposition: form-data; name="text"\r\n\r\n'
+        + b"x" * 100
+    )
+    with pytest.raises(PayloadTooLargeException):
+        parse_multipart([body], max_field_size=10)
+    assert len(uploads) == 1 and uploads[0].file.closed
+
+
+def test_invalid_boundary_is_rejected():
+    with pytest.raises(MalformedRequestException):
+        MultipartParser(boundary="")
+
+
+def test_urlencoded_fields_split_across_feeds():
+    body = b"name=Zoe+the+dog&city=S%C3%A3o%20Paulo&empty=&&flag"
+    parser = UrlencodedParser()
+    for i in range(0, len(body), 3):
+        parser.feed(body[i:i + 3])
+    params = parser.close()
+
+    assert params == {"name": "Zoe the dog", "city": "São Paulo", "empty": "", "flag": ""}
+
+
+def test_urlencoded_field_over_the_limit_is_rejected():
+    parser = UrlencodedParser(max_field_size=8)
+    parser.feed(b"a=1&b=")
+    with pytest.raises(PayloadTooLargeException):
+        parser.feed(b"123456789")
+
+
+def test_urlencoded_field_in_the_wrong_charset_is_rejected():
+    parser = UrlencodedParser(charset="ascii")
+    parser.feed(b"name=S%C3%A3o")
+    with pytest.raises(MalformedRequestException):
+        parser.close()
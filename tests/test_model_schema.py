@@ -0,0 +1,46 @@
+import pytest
+
+from zoe import Model, SchemaError
+
+
+class Point(Model):
+    x: int
+    y: int
+
+
+class Label(Model):
+    text: str
+
+
+class Describable(Model):
+    def describe(self) -> str:
+        return ", ".join(f"{k}={v}" for k, v in self.to_dict().items())
+
+
+def test_model_extending_two_models_with_fields_raises_schema_error():
+    with pytest.raises(SchemaError, match="'Point', 'Label'"):
+        class LabeledPoint(Point, Label):
+            pass
+
+
+def test_schema_error_is_a_type_error():
+    with pytest.raises(TypeError):
+        class LabeledPoint(Label, Point):
+            pass
+
+
+def test_model_can_mix_in_a_model_without_fields():
+    class DescribedPoint(Point, Describable):
+        pass
+
+    assert DescribedPoint(x=1, y=2).describe() == "x=1, y=2"
+
+
+def test_model_can_extend_a_line_of_models():
+    class Point3D(Point):
+        z: int
+
+    class Point3DAgain(Point3D, Point):
+        pass
+
+    assert Point3DAgain(x=1, y=2, z=3).to_dict() == {"x": 1, "y": 2, "z": 3}
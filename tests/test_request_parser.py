@@ -0,0 +1,154 @@
+import pytest
+
+from zoe_http._request_util.request_parser import RequestParser, ChunkedDecoder
+from zoe_exceptions.http_exceptions.exc_malformed_request import MalformedRequestException
+from zoe_exceptions.http_exceptions.exc_payload_too_large import PayloadTooLargeException
+
+
+def parser_with(*pieces: bytes, max_head_size: int = 8192) -> RequestParser:
+    parser = RequestParser(max_head_size=max_head_size)
+    for piece in pieces:
+        parser.feed(piece)
+    return parser
+
+
+def decode_all(decoder: ChunkedDecoder, limit: int = 1024) -> bytes:
+    body = b""
+    while not decoder.done:
+        piece = decoder.read(limit=limit)
+        assert piece is not None, "the whole body was fed"
+        body += piece
+    return body
+
+
+def test_pipelined_heads_are_parsed_in_order_with_their_bodies():
+    parser = parser_with(
+        b"POST /a HTTP/1.1\r\nContent-Length: 3\r\n\r\nabc"
+        b"GET /b?x=1 HTTP/1.1\r\nHost: h\r\n\r\n"
+    )
+
+    first = parser.parse_head()
+    assert first is not None
+    assert (first.method, first.target, first.content_length) == ("POST", "/a", 3)
+    assert parser.take(first.content_length) == b"abc"
+
+    second = parser.parse_head()
+    assert second is not None
+    assert (second.method, second.target, second.header("host")) == ("GET", "/b?x=1", "h")
+    assert not second.has_body
+    assert parser.parse_head() is None
+
+
+def test_head_split_across_feeds_is_parsed_once_complete():
+    parser = RequestParser(max_head_size=8192)
+    raw = b"GET / HTTP/1.1\r\nHost: h\r\nX-Long: " + b"v" * 100 + b"\r\n\r\n"
+
+    # cut inside the terminator too: "\r\n\r" then "\n"
+    for piece in (raw[:5], raw[5:40], raw[40:-1]):
+        parser.feed(piece)
+        assert parser.parse_head() is None
+    parser.feed(raw[-1:])
+
+    head = parser.parse_head()
+    assert head is not None
+    assert head.header("X-Long") == "v" * 100
+    assert parser.buffered == 0
+
+
+def test_peek_head_keeps_the_head_for_parse_head():
+    parser = parser_with(b"GET / HTTP/1.1\r\n\r\n")
+    peeked = parser.peek_head()
+    assert peeked is not None
+    assert parser.parse_head() is peeked
+    assert parser.peek_head() is None
+
+
+def test_empty_lines_before_the_request_line_are_ignored():
+    head = parser_with(b"\r\n\r\nGET / HTTP/1.1\r\n\r\n").parse_head()
+    assert head is not None and head.method == "GET"
+
+
+def test_has_complete_request_waits_for_the_declared_body():
+    parser = parser_with(b"POST / HTTP/1.1\r\nContent-Length: 4\r\n\r\nab")
+    assert not parser.has_complete_request()
+    parser.feed(b"cd")
+    assert parser.has_complete_request()
+
+
+def test_oversized_head_is_rejected():
+    parser = parser_with(b"GET / HTTP/1.1\r\nX: " + b"a" * 200, max_head_size=64)
+    with pytest.raises(MalformedRequestException):
+        parser.parse_head()
+
+
+def test_oversized_head_error_is_kept_for_parse_head_after_a_peek():
+    parser = parser_with(b"GET / HTTP/1.1\r\nX: " + b"a" * 200, max_head_size=64)
+    assert parser.peek_head() is None
+    assert parser.has_complete_request()
+    with pytest.raises(MalformedRequestException):
+        parser.parse_head()
+
+
+def test_invalid_request_line_is_rejected():
+    with pytest.raises(MalformedRequestException):
+        parser_with(b"GET /\r\n\r\n").parse_head()
+
+
+def test_invalid_content_length_is_rejected():
+    with pytest.raises(MalformedRequestException):
+        parser_with(b"POST / HTTP/1.1\r\nContent-Length: -1\r\n\r\n").parse_head()
+
+
+def test_chunked_body_with_extensions_and_trailers():
+    parser = parser_with(
+        b"POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"4;name=value\r\nWiki\r\n"
+        b"5 ; other\r\npedia\r\n"
+        b"0\r\nX-Checksum: 123\r\nX-Other: 4\r\n\r\n"
+        b"GET /next HTTP/1.1\r\n\r\n"
+    )
+    head = parser.parse_head()
+    assert head is not None and head.chunked
+
+    decoder = ChunkedDecoder(parser=parser, max_size=1024)
+    assert decode_all(decoder) == b"Wikipedia"
+    assert decoder.decoded == 9
+
+    following = parser.parse_head()
+    assert following is not None and following.target == "/next"
+
+
+def test_chunked_body_split_across_feeds():
+    raw = b"a\r\n0123456789\r\n3\r\nabc\r\n0\r\n\r\n"
+    parser = RequestParser(max_head_size=8192)
+    decoder = ChunkedDecoder(parser=parser, max_size=1024)
+
+    body = b""
+    for byte in raw:
+        parser.feed(bytes([byte]))
+        while True:
+            piece = decoder.read(limit=4)
+            if not piece:
+                break
+            body += piece
+    assert decoder.done
+    assert body == b"0123456789abc"
+
+
+@pytest.mark.parametrize("size_line", [b"xyz", b"", b"-1", b"0x10"])
+def test_bad_chunk_size_is_rejected(size_line: bytes):
+    parser = parser_with(size_line + b"\r\ndata\r\n0\r\n\r\n")
+    with pytest.raises(MalformedRequestException):
+        decode_all(ChunkedDecoder(parser=parser, max_size=1024))
+
+
+def test_chunk_data_must_end_with_crlf():
+    parser = parser_with(b"3\r\nabcX\r\n0\r\n\r\n")
+    with pytest.raises(MalformedRequestException):
+        decode_all(ChunkedDecoder(parser=parser, max_size=1024))
+
+
+def test_chunked_body_over_the_limit_is_rejected():
+    parser = parser_with(b"8\r\n12345678\r\n0\r\n\r\n")
+    with pytest.raises(PayloadTooLargeException):
+        decode_all(ChunkedDecoder(parser=parser, max_size=4))
@@ -0,0 +1,112 @@
+from zoe import App, Router, Route, Response, HttpCode, HttpMethod
+from zoe_http.request import Request
+from zoe_router.route_tree import RouteTree
+
+
+class Tagged:
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+
+    def handle(self, request: Request) -> Response:
+        return Response.json(HttpCode.OK, {"tag": self.tag, "params": dict(request.path_params)})
+
+
+def request(path: str, method: str = "GET") -> Request:
+    return Request(f"{method} {path} HTTP/1.1\r\nHost: x\r\n\r\n", client_ip="127.0.0.1")
+
+
+def tree(*routes: tuple[str, HttpMethod, str]) -> RouteTree[str]:
+    return RouteTree.compile(routes)
+
+
+def test_static_segment_wins_over_param_whatever_the_order():
+    routes = tree(
+        ("/users/{id}", HttpMethod.GET, "by-id"),
+        ("/users/me", HttpMethod.GET, "me"),
+    )
+    assert routes.match(path="/users/me", method=HttpMethod.GET) == ("me", {}, set())
+    assert routes.match(path="/users/42", method=HttpMethod.GET) == ("by-id", {"id": "42"}, set())
+
+
+def test_param_route_is_found_when_the_static_branch_dead_ends():
+    routes = tree(
+        ("/files/latest/info", HttpMethod.GET, "latest-info"),
+        ("/files/{name}/raw", HttpMethod.GET, "raw"),
+    )
+    assert routes.match(path="/files/latest/raw", method=HttpMethod.GET) == ("raw", {"name": "latest"}, set())
+
+
+def test_param_wins_over_wildcard():
+    routes = tree(
+        ("/static/*", HttpMethod.GET, "any"),
+        ("/static/{name}", HttpMethod.GET, "one"),
+    )
+    assert routes.match(path="/static/a.css", method=HttpMethod.GET)[0] == "one"
+    assert routes.match(path="/static/css/a.css", method=HttpMethod.GET) == ("any", {"wildcard": "css/a.css"}, set())
+
+
+def test_first_route_added_wins_for_the_same_path_and_method():
+    routes = tree(("/a", HttpMethod.GET, "first"), ("/a", HttpMethod.GET, "second"))
+    assert routes.match(path="/a", method=HttpMethod.GET)[0] == "first"
+
+
+def test_trailing_slash_is_ignored():
+    routes = tree(("/a/b", HttpMethod.GET, "ab"))
+    assert routes.match(path="/a/b/", method=HttpMethod.GET)[0] == "ab"
+
+
+def test_allowed_methods_of_an_existing_path():
+    routes = tree(
+        ("/items/{id}", HttpMethod.GET, "get"),
+        ("/items/{id}", HttpMethod.DELETE, "delete"),
+        ("/items/new", HttpMethod.POST, "create"),
+    )
+    assert routes.match(path="/items/7", method=HttpMethod.PUT) == (None, {}, {HttpMethod.GET, HttpMethod.DELETE})
+    # the static branch and the param branch both match "new"
+    target, _, allowed = routes.match(path="/items/new", method=HttpMethod.PUT)
+    assert target is None
+    assert allowed == {HttpMethod.GET, HttpMethod.DELETE, HttpMethod.POST}
+
+
+def test_unknown_path_has_no_allowed_methods():
+    routes = tree(("/a", HttpMethod.GET, "a"))
+    assert routes.match(path="/b", method=HttpMethod.GET) == (None, {}, set())
+
+
+def test_router_prefix_is_joined_to_its_routes():
+    app = App()
+    router = Router("/api/v1")
+    router.GET("/users/{id}", Tagged("user"))
+    app.use(router)
+
+    response = app._resolve(request("/api/v1/users/5"))
+    assert response.status_code == HttpCode.OK
+    assert b'"params": {"id": "5"}' in response._build()
+    assert app._resolve(request("/users/5")).status_code == HttpCode.NOT_FOUND
+
+
+def test_app_answers_405_with_allow_across_routers():
+    app = App()
+    app.use(Router("/r").GET("/x", Tagged("get")))
+    app.use(Router("/r").DELETE("/x", Tagged("delete")))
+
+    assert app._resolve(request("/r/x", method="DELETE")).status_code == HttpCode.OK
+    response = app._resolve(request("/r/x", method="PUT"))
+    assert response.status_code == HttpCode.METHOD_NOT_ALLOWED
+    assert b"Allow: DELETE, GET\r\n" in response._build()
+
+
+def test_routes_added_after_the_first_request_are_matched():
+    app = App()
+    router = Router("/late")
+    router.GET("/a", Tagged("a"))
+    app.use(router)
+    assert app._resolve(request("/late/b")).status_code == HttpCode.NOT_FOUND
+
+    router.GET("/b", Tagged("b"))
+    assert app._resolve(request("/late/b")).status_code == HttpCode.OK
+
+    router.assigned_routes.add(Route.get(endpoint="/c", handler=Tagged("c")))
+    assert app._resolve(request("/late/c")).status_code == HttpCode.OK
+    resolved = router.resolve(method=HttpMethod.GET, request=request("/late/c"))
+    assert resolved is not None and resolved.status_code == HttpCode.OK